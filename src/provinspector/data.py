@@ -5,7 +5,7 @@ from typing import Any
 from provinspector.domain.constants import OperatorStepType, PipelineChangeType
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineChangeData(ABC):
     """
     Abstract base class for pipeline change data.
@@ -19,7 +19,7 @@ class PipelineChangeData(ABC):
     change_type: PipelineChangeType = field(init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatorCreationPipelineChangeData(PipelineChangeData):
     """
     Operation creation pipeline change data.
@@ -39,7 +39,7 @@ class OperatorCreationPipelineChangeData(PipelineChangeData):
         self.change_type = PipelineChangeType.OPERATOR_CREATION
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatorModificationPipelineChangeData(PipelineChangeData):
     """
     Operation modification pipeline change data.
@@ -60,7 +60,7 @@ class OperatorModificationPipelineChangeData(PipelineChangeData):
         self.change_type = PipelineChangeType.OPERATOR_MODIFICATION
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatorDeletionPipelineChangeData(PipelineChangeData):
     """
     Operation deletion pipeline change data.
@@ -77,7 +77,7 @@ class OperatorDeletionPipelineChangeData(PipelineChangeData):
         self.change_type = PipelineChangeType.OPERATOR_DELETION
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionCreationPipelineChangeData(PipelineChangeData):
     """
     Connection creation pipeline change data.
@@ -101,7 +101,7 @@ class ConnectionCreationPipelineChangeData(PipelineChangeData):
         self.change_type = PipelineChangeType.CONNECTION_CREATION
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionDeletionPipelineChangeData(PipelineChangeData):
     """
     Connection deletion pipeline change data.
@@ -121,7 +121,7 @@ class ConnectionDeletionPipelineChangeData(PipelineChangeData):
         self.change_type = PipelineChangeType.CONNECTION_DELETION
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricData:
     """
     Metric data.
@@ -135,7 +135,7 @@ class MetricData:
     value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugStepData:
     """
     Debug step data relevant for the provenance inspector.
@@ -1,3 +1,4 @@
+import sys
 from enum import Enum
 
 import prov.constants
@@ -100,22 +101,24 @@ class OperatorStepType(Enum):
 
 
 class ProvRole:
-    CREATED_PIPELINE_VERSION = "CreatedPipelineVersion"
-    CREATED_PIPELINE_VERSION_REVISION = "CreatedPipelineVersionRevision"
+    CREATED_PIPELINE_VERSION = sys.intern("CreatedPipelineVersion")
+    CREATED_PIPELINE_VERSION_REVISION = sys.intern("CreatedPipelineVersionRevision")
 
-    CREATED_OPERATOR = "CreatedOperator"
-    MODIFIED_OPERATOR = "ModifiedOperator"
-    DELETED_OPERATOR = "DeletedOperator"
+    CREATED_OPERATOR = sys.intern("CreatedOperator")
+    MODIFIED_OPERATOR = sys.intern("ModifiedOperator")
+    DELETED_OPERATOR = sys.intern("DeletedOperator")
 
-    CREATED_CONNECTION = "CreatedConnection"
-    DELETED_CONNECTION = "DeletedConnection"
+    CREATED_CONNECTION = sys.intern("CreatedConnection")
+    DELETED_CONNECTION = sys.intern("DeletedConnection")
 
-    CREATED_OPERATOR_RUN = "AddedOperatorRun"
+    CREATED_OPERATOR_RUN = sys.intern("AddedOperatorRun")
 
-    USED_PARENT_PIPELINE_VERSION = "UsedParentPipelineVersion"
-    USED_PARENT_PIPELINE_VERSION_REVISION = "UsedParentPipelineVersionRevision"
-    USED_OPERATOR_REVISION = "UsedOperatorRevision"
-    USED_PARENT_OPERATOR_REVISION = "UsedParentOperatorRevision"
+    USED_PARENT_PIPELINE_VERSION = sys.intern("UsedParentPipelineVersion")
+    USED_PARENT_PIPELINE_VERSION_REVISION = sys.intern(
+        "UsedParentPipelineVersionRevision"
+    )
+    USED_OPERATOR_REVISION = sys.intern("UsedOperatorRevision")
+    USED_PARENT_OPERATOR_REVISION = sys.intern("UsedParentOperatorRevision")
 
 
 class ProvType:
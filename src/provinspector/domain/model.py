@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import math
+import struct
 import urllib.parse
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 import prov.model
 
@@ -14,8 +16,15 @@ from provinspector.domain.constants import (
 )
 from provinspector.utils.prov_utils import document_factory, qualified_name
 
+# String forms of the change and step types, computed once as the type is
+# constant per `PipelineChange` subclass and enum member
+_PIPELINE_CHANGE_TYPE_STR = {
+    change_type: str(change_type) for change_type in PipelineChangeType
+}
+_OPERATOR_STEP_TYPE_STR = {step_type: str(step_type) for step_type in OperatorStepType}
 
-@dataclass
+
+@dataclass(slots=True)
 class PipelineVersion:
     """
     An entity representing a version of the pipeline.
@@ -28,8 +37,13 @@ class PipelineVersion:
         `created_at`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "PipelineVersion?id=%s"
+
     id_: int
     parent_pipeline_version_id: int | None
+    _prov_record: prov.model.ProvEntity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
@@ -37,22 +51,27 @@ class PipelineVersion:
             str(self.id_), safe="", encoding=None, errors=None
         )
 
-        return qualified_name(f"PipelineVersion?id={id_}")
+        return qualified_name(self._ID_TEMPLATE % id_)
 
     def to_prov(self) -> prov.model.ProvEntity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("id", self.id_),
             (prov.model.PROV_TYPE, ProvType.PIPELINE_VERSION),
         ]
 
-        return prov.model.ProvEntity(
+        self._prov_record = prov.model.ProvEntity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
 
-@dataclass
+
+@dataclass(slots=True)
 class PipelineVersionRevision:
     """
     An entity representing a revision of a pipeline version.
@@ -70,34 +89,44 @@ class PipelineVersionRevision:
         `connections`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "PipelineVersionRevision?uuid=%s"
+
     uuid: str
     id_: int
     pipeline_version: PipelineVersion
     parent_pipeline_version_revision_uuid: str | None
     operators: list[OperatorRevision]
     connections: list[Connection]
+    _prov_record: prov.model.ProvEntity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
         uuid = urllib.parse.quote_plus(self.uuid, safe="", encoding=None, errors=None)
 
-        return qualified_name(f"PipelineVersionRevision?uuid={uuid}")
+        return qualified_name(self._ID_TEMPLATE % uuid)
 
     def to_prov(self) -> prov.model.ProvEntity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("uuid", self.uuid),
             ("id", self.id_),
             (prov.model.PROV_TYPE, ProvType.PIPELINE_VERSION_REVISION),
         ]
 
-        return prov.model.ProvEntity(
+        self._prov_record = prov.model.ProvEntity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
+
 
-@dataclass
+@dataclass(slots=True)
 class Operator:
     """
     An entity representing an operator of a pipeline.
@@ -109,8 +138,13 @@ class Operator:
         `name`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "Operator?id=%s"
+
     id_: int
     name: str
+    _prov_record: prov.model.ProvEntity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
@@ -118,23 +152,28 @@ class Operator:
             str(self.id_), safe="", encoding=None, errors=None
         )
 
-        return qualified_name(f"Operator?id={id_}")
+        return qualified_name(self._ID_TEMPLATE % id_)
 
     def to_prov(self) -> prov.model.ProvEntity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("id", self.id_),
             ("name", self.name),
             (prov.model.PROV_TYPE, ProvType.OPERATOR),
         ]
 
-        return prov.model.ProvEntity(
+        self._prov_record = prov.model.ProvEntity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
 
-@dataclass
+
+@dataclass(slots=True)
 class OperatorRevision:
     """
     An entity representing a revision of an operator.
@@ -147,33 +186,43 @@ class OperatorRevision:
         `parent_operator_revision`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "OperatorRevision?uuid=%s"
+
     uuid: str
     id_: int
     operator: Operator
     parameters: list[Parameter]
     parent_operator_revision_uuid: str | None
+    _prov_record: prov.model.ProvEntity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
         uuid = urllib.parse.quote_plus(self.uuid, safe="", encoding=None, errors=None)
 
-        return qualified_name(f"OperatorRevision?uuid={uuid}")
+        return qualified_name(self._ID_TEMPLATE % uuid)
 
     def to_prov(self) -> prov.model.ProvEntity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("uuid", self.uuid),
             ("id", self.id_),
             (prov.model.PROV_TYPE, ProvType.OPERATOR_REVISION),
         ]
 
-        return prov.model.ProvEntity(
+        self._prov_record = prov.model.ProvEntity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
 
-@dataclass
+
+@dataclass(slots=True)
 class Parameter:
     """
     An entity representing a parameter of an operator.
@@ -183,31 +232,52 @@ class Parameter:
         `value`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "Parameter?name=%s&value=%s"
+
     name: str
     value: Any
+    _prov_record: prov.model.ProvEntity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Quantize float values to FP32; parameter values only feed hashed
+        # identifiers and attributes, which do not need full FP64 precision
+        if type(self.value) is float:
+            try:
+                self.value = struct.unpack("<f", struct.pack("<f", self.value))[0]
+            except OverflowError:
+                # Values beyond the float32 range saturate to infinity, as a
+                # real float32 cast would
+                self.value = math.copysign(math.inf, self.value)
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
         name = urllib.parse.quote_plus(self.name, safe="", encoding=None, errors=None)
         value_hash = hash(self.value)
 
-        return qualified_name(f"Parameter?name={name}&value={value_hash}")
+        return qualified_name(self._ID_TEMPLATE % (name, value_hash))
 
     def to_prov(self) -> prov.model.ProvEntity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("name", self.name),
             ("value", hash(self.value)),
             (prov.model.PROV_TYPE, ProvType.PARAMETER),
         ]
 
-        return prov.model.ProvEntity(
+        self._prov_record = prov.model.ProvEntity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
+
 
-@dataclass
+@dataclass(slots=True)
 class OperatorRun:
     """
     An entity representing a collection of entities generated by the execution of an `OperatorRevision`.
@@ -218,17 +288,25 @@ class OperatorRun:
         `metrics`: list of metrics created by the run
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "OperatorRun?id=%s"
+
     id_: str
     created_at: datetime
     metrics: list[Metric]
+    _prov_record: prov.model.ProvEntity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
         id_ = urllib.parse.quote_plus(self.id_, safe="", encoding=None, errors=None)
 
-        return qualified_name(f"OperatorRun?id={id_}")
+        return qualified_name(self._ID_TEMPLATE % id_)
 
     def to_prov(self) -> prov.model.ProvEntity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("id", self.id_),
             ("time", self.created_at),
@@ -236,14 +314,16 @@ class OperatorRun:
             (prov.model.PROV_TYPE, ProvType.COLLECTION),
         ]
 
-        return prov.model.ProvEntity(
+        self._prov_record = prov.model.ProvEntity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
+
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     """
     An entity representing a metric created by a run of an operator (more specifically, `OperatorRevision`).
@@ -255,31 +335,41 @@ class Metric:
         `created_at`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "Metric?name=%s&value=%s"
+
     name: str
     value: float
+    _prov_record: prov.model.ProvEntity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
         name = urllib.parse.quote_plus(self.name, safe="", encoding=None, errors=None)
         value = str(self.value)
 
-        return qualified_name(f"Metric?name={name}&value={value}")
+        return qualified_name(self._ID_TEMPLATE % (name, value))
 
     def to_prov(self) -> prov.model.ProvEntity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("name", self.name),
             ("value", self.value),
             (prov.model.PROV_TYPE, ProvType.METRIC),
         ]
 
-        return prov.model.ProvEntity(
+        self._prov_record = prov.model.ProvEntity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
 
-@dataclass
+
+@dataclass(slots=True)
 class Connection:
     """
     An entity representing the connection between two operators.
@@ -291,9 +381,14 @@ class Connection:
         `created_at`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "Connection?id=%s"
+
     id_: int
     from_operator_id: int
     to_operator_id: int
+    _prov_record: prov.model.ProvEntity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
@@ -301,9 +396,12 @@ class Connection:
             str(self.id_), safe="", encoding=None, errors=None
         )
 
-        return qualified_name(f"Connection?id={id_}")
+        return qualified_name(self._ID_TEMPLATE % id_)
 
     def to_prov(self) -> prov.model.ProvEntity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("id", self.id_),
             ("from_operator_id", str(self.from_operator_id)),
@@ -311,14 +409,16 @@ class Connection:
             (prov.model.PROV_TYPE, ProvType.CONNECTION),
         ]
 
-        return prov.model.ProvEntity(
+        self._prov_record = prov.model.ProvEntity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
+
 
-@dataclass
+@dataclass(slots=True)
 class PipelineVersionCreation:
     """
     An activity representing the creation of a pipeline version.
@@ -330,10 +430,15 @@ class PipelineVersionCreation:
         `time`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "PipelineVersionCreation?uuid=%s"
+
     uuid: str
     pipeline_version_revision: PipelineVersionRevision
     parent_pipeline_version_creation_uuid: str | None
     time: datetime
+    _prov_record: prov.model.ProvActivity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
@@ -341,9 +446,12 @@ class PipelineVersionCreation:
             str(self.uuid), safe="", encoding=None, errors=None
         )
 
-        return qualified_name(f"PipelineVersionCreation?uuid={uuid}")
+        return qualified_name(self._ID_TEMPLATE % uuid)
 
     def to_prov(self) -> prov.model.ProvActivity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("uuid", self.uuid),
             (prov.model.PROV_ATTR_STARTTIME, self.time),
@@ -351,14 +459,16 @@ class PipelineVersionCreation:
             (prov.model.PROV_TYPE, ProvType.PIPELINE_VERSION_CREATION),
         ]
 
-        return prov.model.ProvActivity(
+        self._prov_record = prov.model.ProvActivity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
+
 
-@dataclass
+@dataclass(slots=True)
 class PipelineChange:
     """
     An activity representing different pipelines changes.
@@ -375,6 +485,8 @@ class PipelineChange:
         `parent_pipeline_change_uuid`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "PipelineChange?uuid=%s"
+
     uuid: str
     pipeline_change_type: PipelineChangeType
     time: datetime
@@ -382,6 +494,9 @@ class PipelineChange:
     connection: Connection | None
     pipeline_version_revision: PipelineVersionRevision
     parent_pipeline_change_uuid: str | None
+    _prov_record: prov.model.ProvActivity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
@@ -389,25 +504,33 @@ class PipelineChange:
             str(self.uuid), safe="", encoding=None, errors=None
         )
 
-        return qualified_name(f"PipelineChange?uuid={uuid}")
+        return qualified_name(self._ID_TEMPLATE % uuid)
 
     def to_prov(self) -> prov.model.ProvActivity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("uuid", self.uuid),
-            ("pipeline_change_type", str(self.pipeline_change_type)),
+            (
+                "pipeline_change_type",
+                _PIPELINE_CHANGE_TYPE_STR[self.pipeline_change_type],
+            ),
             (prov.model.PROV_ATTR_STARTTIME, self.time),
             (prov.model.PROV_ATTR_ENDTIME, self.time),
             (prov.model.PROV_TYPE, ProvType.PIPELINE_CHANGE),
         ]
 
-        return prov.model.ProvActivity(
+        self._prov_record = prov.model.ProvActivity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
 
+        return self._prov_record
 
-@dataclass
+
+@dataclass(slots=True)
 class OperatorCreationPipelineChange(PipelineChange):
     """
     An activity representing the pipeline change resulting from the creation of an operator.
@@ -422,7 +545,7 @@ class OperatorCreationPipelineChange(PipelineChange):
         self.connection = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatorModificationPipelineChange(PipelineChange):
     """
     An activity representing the pipeline change resulting from the modification of an operator.
@@ -437,7 +560,7 @@ class OperatorModificationPipelineChange(PipelineChange):
         self.connection = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatorDeletionPipelineChange(PipelineChange):
     """
     An activity representing the pipeline change resulting from the deletion of an operator.
@@ -452,7 +575,7 @@ class OperatorDeletionPipelineChange(PipelineChange):
         self.connection = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionCreationPipelineChange(PipelineChange):
     """
     An activity representing the pipeline change resulting from the creation of a connection.
@@ -467,7 +590,7 @@ class ConnectionCreationPipelineChange(PipelineChange):
         self.operator_revision = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionDeletionPipelineChange(PipelineChange):
     """
     An activity representing the pipeline change resulting from the deletion of a connection.
@@ -482,7 +605,7 @@ class ConnectionDeletionPipelineChange(PipelineChange):
         self.operator_revision = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatorExecution:
     """
     An activity representing the execution of an operator (more specifically, `OperatorRevision`).
@@ -495,11 +618,16 @@ class OperatorExecution:
         `time`
     """
 
+    _ID_TEMPLATE: ClassVar[str] = "OperatorExecution?uuid=%s"
+
     uuid: str
     operator_revision: OperatorRevision
     operator_run: OperatorRun
     operator_step_type: OperatorStepType
     time: datetime
+    _prov_record: prov.model.ProvActivity | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def prov_identifier(self) -> prov.model.QualifiedName:
@@ -507,19 +635,24 @@ class OperatorExecution:
             str(self.uuid), safe="", encoding=None, errors=None
         )
 
-        return qualified_name(f"OperatorExecution?uuid={uuid}")
+        return qualified_name(self._ID_TEMPLATE % uuid)
 
     def to_prov(self) -> prov.model.ProvActivity:
+        if self._prov_record is not None:
+            return self._prov_record
+
         prov_attributes = [
             ("uuid", self.uuid),
-            ("pipeline_change_type", str(self.operator_step_type)),
+            ("pipeline_change_type", _OPERATOR_STEP_TYPE_STR[self.operator_step_type]),
             (prov.model.PROV_ATTR_STARTTIME, self.time),
             (prov.model.PROV_ATTR_ENDTIME, self.time),
             (prov.model.PROV_TYPE, ProvType.OPERATOR_EXECUTION),
         ]
 
-        return prov.model.ProvActivity(
+        self._prov_record = prov.model.ProvActivity(
             document_factory(),
             self.prov_identifier,
             prov_attributes,
         )
+
+        return self._prov_record
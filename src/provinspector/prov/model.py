@@ -1,4 +1,7 @@
 import abc
+import contextlib
+import functools
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Type
 
@@ -20,6 +23,71 @@ from provinspector.domain.model import (
 
 DEFAULT_NAMESPACE = prov.model.Namespace("ex", "example.org")
 
+_RELATION_PREFIX = sys.intern("relation:")
+
+# Attribute keys shared by every relation; computed and interned once so the
+# per-relation attribute dicts reuse the same key objects
+_PROV_ATTR_TIME_STR = sys.intern(str(prov.model.PROV_ATTR_TIME))
+_PROV_ROLE_STR = sys.intern(str(prov.model.PROV_ROLE))
+
+
+@functools.lru_cache(maxsize=4096)
+def relation_qualified_name(
+    source_identifier: str,
+    target_identifier: str,
+) -> prov.model.QualifiedName:
+    """
+    Return the qualified name of a relation between a source and a target identifier.
+
+    Identifier pairs recur across submodels, so the qualified names are cached. Cold misses build the local part with plain concatenation of the interned prefix, which skips the f-string formatting machinery.
+    """
+
+    return prov.model.QualifiedName(
+        DEFAULT_NAMESPACE,
+        _RELATION_PREFIX + source_identifier + ":" + target_identifier,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _identifier_str(identifier: prov.model.QualifiedName) -> str:
+    """
+    Return the string form of a qualified name.
+
+    Element identifiers are stable across the memoized domain records, so the string conversion is cached instead of re-running `QualifiedName.__str__` for every relation endpoint.
+    """
+
+    return str(identifier)
+
+
+@dataclass(frozen=True)
+class ProvProjection:
+    """
+    A flat projection of the PROV record of a domain dataclass instance.
+
+    Bundles the identifier, start and end time, and attributes of a record, so consumers read them from one struct instead of dispatching into the record for every field.
+    """
+
+    identifier: prov.model.QualifiedName
+    start_time: Any
+    end_time: Any
+    attributes: list
+
+
+def project(dataclass_instance) -> ProvProjection:
+    """
+    Project the PROV record of a domain dataclass instance into a `ProvProjection`.
+    """
+
+    record = dataclass_instance.to_prov()
+    is_activity = isinstance(record, prov.model.ProvActivity)
+
+    return ProvProjection(
+        identifier=record.identifier,
+        start_time=record.get_startTime() if is_activity else None,
+        end_time=record.get_endTime() if is_activity else None,
+        attributes=record.attributes,
+    )
+
 
 class ProvRevision(prov.model.ProvDerivation):
     """Provenance revision relationship."""
@@ -35,11 +103,13 @@ class ProvRevision(prov.model.ProvDerivation):
     )
 
 
-@dataclass
+@dataclass(eq=False)
 class ProvContext:
     """
     The provenance context supporting the creation of provenance submodels.
 
+    Contexts compare equal iff their documents contain the same records. The comparison uses a cached canonical signature, which is a one-shot sort instead of the quadratic record-bag scan of `ProvDocument.__eq__`.
+
     Attributes:
         `document`
         `namespace`
@@ -47,22 +117,72 @@ class ProvContext:
 
     document: prov.model.ProvDocument
     namespace: str | None = None
+    _signature: frozenset | None = field(default=None, init=False, repr=False)
+    _entity_index: dict[prov.model.QualifiedName, prov.model.ProvRecord] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def canonical_signature(self) -> frozenset:
+        """
+        Return a frozenset of record fingerprints of the context's document.
+        """
+
+        if self._signature is None:
+            # Duplicate records collapse into one fingerprint, matching the
+            # set semantics of the record-bag comparison in `prov`; set
+            # equality also removes the need to sort the fingerprints
+            self._signature = frozenset(
+                (
+                    str(record._prov_type),
+                    str(record.identifier),
+                    tuple(sorted(map(str, record.attributes))),
+                )
+                for record in self.document.records
+            )
+
+        return self._signature
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ProvContext):
+            return NotImplemented
+
+        return self.canonical_signature() == other.canonical_signature()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Collect records created within the block in a staging list and append them to the document in a single extend on exit.
+        """
+
+        records = self.document._records
+        staging: list = []
+        self.document._records = staging
+
+        try:
+            yield
+        finally:
+            self.document._records = records
+            records.extend(staging)
 
     def add_element(
         self,
         dataclass_instance,
-        check_exists=False,
     ) -> prov.model.ProvRecord:
         element = dataclass_instance.to_prov()
 
-        if check_exists:
-            record = self.document.get_record(element.identifier)
-            if record:
-                return record[0]
+        # Identifiers embed the instance's uuid or content hash, so a record
+        # with the same identifier is the same element and can be reused
+        record = self._entity_index.get(element.identifier)
+        if record is not None:
+            return record
 
-        return self.document.new_record(
+        self._signature = None
+        record = self.document.new_record(
             element._prov_type, element.identifier, element.attributes
         )
+        self._entity_index[element.identifier] = record
+
+        return record
 
     def add_relation(
         self,
@@ -70,38 +190,71 @@ class ProvContext:
         target_dataclass_instance,
         relationship_type: Type[prov.model.ProvRelation],
         attributes: dict[str, Any] | None = None,
-        check_exists=False,
     ) -> None:
-        if not attributes:
-            attributes = dict()
+        self._signature = None
 
         source = source_dataclass_instance.to_prov()
         target = target_dataclass_instance.to_prov()
 
-        relationship = self.document.new_record(
-            record_type=relationship_type._prov_type,
-            identifier=(
-                prov.model.QualifiedName(
-                    DEFAULT_NAMESPACE,
-                    f"relation:{source.identifier}:{target.identifier}",
+        # Construct the record directly and append it, skipping the identifier
+        # validation and id-map bookkeeping of `new_record`; the cached relation
+        # qualified names are already valid
+        relationship = relationship_type(
+            self.document,
+            (
+                relation_qualified_name(
+                    _identifier_str(source.identifier),
+                    _identifier_str(target.identifier),
                 )
                 if relationship_type is not prov.model.ProvSpecialization
                 and relationship_type is not prov.model.ProvMembership
                 else None
             ),
-            attributes={
+            {
                 relationship_type.FORMAL_ATTRIBUTES[0]: source,  # type: ignore
                 relationship_type.FORMAL_ATTRIBUTES[1]: target,  # type: ignore
             },
         )
 
-        relationship.add_attributes(attributes)
+        if attributes:
+            relationship.add_attributes(attributes)
 
         if relationship_type == ProvRevision:
             relationship.add_asserted_type(prov.model.PROV["Revision"])
 
+        self.document._records.append(relationship)
+
         return relationship
 
+    def add_members_bulk(
+        self,
+        collection_dataclass_instance,
+        dataclass_instances,
+    ) -> None:
+        """
+        Add a membership relation from a collection to each of the given dataclass instances.
+
+        The membership records are constructed in one pass and appended to the document in a single extend, instead of one `add_relation` round trip per member.
+        """
+
+        self._signature = None
+
+        collection = collection_dataclass_instance.to_prov()
+
+        records = [
+            prov.model.ProvMembership(
+                self.document,
+                None,
+                {
+                    prov.model.PROV_ATTR_COLLECTION: collection,
+                    prov.model.PROV_ATTR_ENTITY: instance.to_prov(),
+                },
+            )
+            for instance in dataclass_instances
+        ]
+
+        self.document._records.extend(records)
+
 
 @dataclass
 class Model(abc.ABC):
@@ -138,114 +291,112 @@ class PipelineVersionCreationModel(Model):
     parent_pipeline_version_creation: PipelineVersionCreation | None
 
     def build(self) -> prov.model.ProvDocument:
-        # Add `PipelineVersionCreation`, parent `PipelineVersionCreation`, and relation
-        self.context.add_element(self.pipeline_version_creation)
-        if self.parent_pipeline_version_creation:
-            self.context.add_element(self.parent_pipeline_version_creation)
-            self.context.add_relation(
-                self.pipeline_version_creation,
-                self.parent_pipeline_version_creation,
-                prov.model.ProvCommunication,
-            )
+        with self.context.batch():
+            # Add `PipelineVersionCreation`, parent `PipelineVersionCreation`, and relation
+            self.context.add_element(self.pipeline_version_creation)
+            if self.parent_pipeline_version_creation:
+                self.context.add_element(self.parent_pipeline_version_creation)
+                self.context.add_relation(
+                    self.pipeline_version_creation,
+                    self.parent_pipeline_version_creation,
+                    prov.model.ProvCommunication,
+                )
 
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = (
-            self.pipeline_version_creation.pipeline_version_revision
-        )
-        self.context.add_element(pipeline_version_revision)
-        for operator_revision in pipeline_version_revision.operators:
-            self.context.add_element(operator_revision)
-            self.context.add_relation(
-                pipeline_version_revision,
-                operator_revision,
-                prov.model.ProvMembership,
-            )
-            # Also add `Operator` for initialization, make optional?
-            operator = operator_revision.operator
-            self.context.add_element(operator)
-            self.context.add_relation(
-                operator_revision,
-                operator,
-                prov.model.ProvSpecialization,
-            )
-        for connection in pipeline_version_revision.connections:
-            self.context.add_element(connection)
-            self.context.add_relation(
+            # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
+            pipeline_version_revision = (
+                self.pipeline_version_creation.pipeline_version_revision
+            )
+            self.context.add_element(pipeline_version_revision)
+            for operator_revision in pipeline_version_revision.operators:
+                self.context.add_element(operator_revision)
+                # Also add `Operator` for initialization, make optional?
+                operator = operator_revision.operator
+                self.context.add_element(operator)
+                self.context.add_relation(
+                    operator_revision,
+                    operator,
+                    prov.model.ProvSpecialization,
+                )
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                connection,
-                prov.model.ProvMembership,
-            )
-        self.context.add_relation(
-            pipeline_version_revision,
-            self.pipeline_version_creation,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_version_creation.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_PIPELINE_VERSION_REVISION,
-            },
-        )
-
-        # Add parent `PipelineVersionRevision`, and relations
-        if self.parent_pipeline_version_revision:
-            self.context.add_element(self.parent_pipeline_version_revision)
+                pipeline_version_revision.operators,
+            )
+            for connection in pipeline_version_revision.connections:
+                self.context.add_element(connection)
+                self.context.add_relation(
+                    pipeline_version_revision,
+                    connection,
+                    prov.model.ProvMembership,
+                )
             self.context.add_relation(
                 pipeline_version_revision,
-                self.parent_pipeline_version_revision,
-                prov.model.ProvDerivation,
-            )
-            self.context.add_relation(
                 self.pipeline_version_creation,
-                self.parent_pipeline_version_revision,
-                prov.model.ProvUsage,
+                prov.model.ProvGeneration,
                 {
-                    str(prov.model.PROV_ATTR_TIME): self.pipeline_version_creation.time,
-                    str(
-                        prov.model.PROV_ROLE
-                    ): ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    _PROV_ATTR_TIME_STR: self.pipeline_version_creation.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_PIPELINE_VERSION_REVISION,
                 },
             )
 
-        # Add created `PipelineVersion`, parent `PipelineVersion`, and relations
-        pipeline_version = pipeline_version_revision.pipeline_version
-        self.context.add_element(pipeline_version)
-        self.context.add_relation(
-            pipeline_version_revision,
-            pipeline_version_revision.pipeline_version,
-            prov.model.ProvSpecialization,
-        )
-        self.context.add_relation(
-            pipeline_version,
-            self.pipeline_version_creation,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_version_creation.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_PIPELINE_VERSION,
-            },
-        )
-        if self.parent_pipeline_version_creation:
-            parent_pipeline_version = (
-                self.parent_pipeline_version_creation.pipeline_version_revision.pipeline_version
-            )
-            self.context.add_element(parent_pipeline_version)
+            # Add parent `PipelineVersionRevision`, and relations
+            if self.parent_pipeline_version_revision:
+                self.context.add_element(self.parent_pipeline_version_revision)
+                self.context.add_relation(
+                    pipeline_version_revision,
+                    self.parent_pipeline_version_revision,
+                    prov.model.ProvDerivation,
+                )
+                self.context.add_relation(
+                    self.pipeline_version_creation,
+                    self.parent_pipeline_version_revision,
+                    prov.model.ProvUsage,
+                    {
+                        _PROV_ATTR_TIME_STR: self.pipeline_version_creation.time,
+                        _PROV_ROLE_STR: ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    },
+                )
+
+            # Add created `PipelineVersion`, parent `PipelineVersion`, and relations
+            pipeline_version = pipeline_version_revision.pipeline_version
+            self.context.add_element(pipeline_version)
             self.context.add_relation(
-                self.parent_pipeline_version_revision,
-                parent_pipeline_version,
+                pipeline_version_revision,
+                pipeline_version_revision.pipeline_version,
                 prov.model.ProvSpecialization,
             )
             self.context.add_relation(
                 pipeline_version,
-                parent_pipeline_version,
-                prov.model.ProvDerivation,
-            )
-            self.context.add_relation(
                 self.pipeline_version_creation,
-                parent_pipeline_version,
-                prov.model.ProvUsage,
+                prov.model.ProvGeneration,
                 {
-                    str(prov.model.PROV_ATTR_TIME): self.pipeline_version_creation.time,
-                    str(prov.model.PROV_ROLE): ProvRole.USED_PARENT_PIPELINE_VERSION,
+                    _PROV_ATTR_TIME_STR: self.pipeline_version_creation.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_PIPELINE_VERSION,
                 },
             )
+            if self.parent_pipeline_version_creation:
+                parent_pipeline_version = (
+                    self.parent_pipeline_version_creation.pipeline_version_revision.pipeline_version
+                )
+                self.context.add_element(parent_pipeline_version)
+                self.context.add_relation(
+                    self.parent_pipeline_version_revision,
+                    parent_pipeline_version,
+                    prov.model.ProvSpecialization,
+                )
+                self.context.add_relation(
+                    pipeline_version,
+                    parent_pipeline_version,
+                    prov.model.ProvDerivation,
+                )
+                self.context.add_relation(
+                    self.pipeline_version_creation,
+                    parent_pipeline_version,
+                    prov.model.ProvUsage,
+                    {
+                        _PROV_ATTR_TIME_STR: self.pipeline_version_creation.time,
+                        _PROV_ROLE_STR: ProvRole.USED_PARENT_PIPELINE_VERSION,
+                    },
+                )
 
         return self.context.document
 
@@ -266,102 +417,97 @@ class OperatorCreationModel(Model):
     parent_pipeline_version_revision: PipelineVersionRevision | None
 
     def build(self) -> prov.model.ProvDocument:
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        self.context.add_element(self.pipeline_change)
-        if self.parent_pipeline_change:
-            self.context.add_element(self.parent_pipeline_change)
+        with self.context.batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            self.context.add_element(self.pipeline_change)
+            if self.parent_pipeline_change:
+                self.context.add_element(self.parent_pipeline_change)
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_change,
+                    prov.model.ProvCommunication,
+                )
+
+            # Add created `Operator`, corresponding `OperatorRevision`, and relations
+            operator_revision = self.pipeline_change.operator_revision
+            self.context.add_element(operator_revision)
             self.context.add_relation(
+                operator_revision,
                 self.pipeline_change,
-                self.parent_pipeline_change,
-                prov.model.ProvCommunication,
+                prov.model.ProvGeneration,
+                {
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_OPERATOR,
+                },
             )
-
-        # Add created `Operator`, corresponding `OperatorRevision`, and relations
-        operator_revision = self.pipeline_change.operator_revision
-        self.context.add_element(operator_revision)
-        self.context.add_relation(
-            operator_revision,
-            self.pipeline_change,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_OPERATOR,
-            },
-        )
-        operator = operator_revision.operator
-        self.context.add_element(operator)
-        self.context.add_relation(
-            operator_revision,
-            operator,
-            prov.model.ProvSpecialization,
-        )
-
-        # Add operator parameters and relations
-        for parameter in operator_revision.parameters:
-            self.context.add_element(parameter)
+            operator = operator_revision.operator
+            self.context.add_element(operator)
             self.context.add_relation(
                 operator_revision,
-                parameter,
-                prov.model.ProvMembership,
+                operator,
+                prov.model.ProvSpecialization,
             )
 
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = self.pipeline_change.pipeline_version_revision
-        self.context.add_element(pipeline_version_revision)
-        for operator_revision in pipeline_version_revision.operators:
-            self.context.add_element(
-                operator_revision,
+            # Add operator parameters and relations
+            for parameter in operator_revision.parameters:
+                self.context.add_element(parameter)
+            self.context.add_members_bulk(
+                operator_revision, operator_revision.parameters
             )
-            self.context.add_relation(
+
+            # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
+            pipeline_version_revision = self.pipeline_change.pipeline_version_revision
+            self.context.add_element(pipeline_version_revision)
+            for operator_revision in pipeline_version_revision.operators:
+                self.context.add_element(
+                    operator_revision,
+                )
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                operator_revision,
-                prov.model.ProvMembership,
+                pipeline_version_revision.operators,
             )
-        for connection in pipeline_version_revision.connections:
-            self.context.add_element(
-                connection,
-            )
-            self.context.add_relation(
+            for connection in pipeline_version_revision.connections:
+                self.context.add_element(
+                    connection,
+                )
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                connection,
-                prov.model.ProvMembership,
+                pipeline_version_revision.connections,
             )
-        self.context.add_relation(
-            pipeline_version_revision,
-            self.pipeline_change,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_PIPELINE_VERSION_REVISION,
-            },
-        )
-
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        self.context.add_element(pipeline_version_revision.pipeline_version)
-        self.context.add_relation(
-            pipeline_version_revision,
-            pipeline_version_revision.pipeline_version,
-            prov.model.ProvSpecialization,
-        )
-        if self.parent_pipeline_version_revision:
-            self.context.add_element(self.parent_pipeline_version_revision)
             self.context.add_relation(
                 pipeline_version_revision,
-                self.parent_pipeline_version_revision,
-                ProvRevision,
-            )
-            self.context.add_relation(
                 self.pipeline_change,
-                self.parent_pipeline_version_revision,
-                prov.model.ProvUsage,
+                prov.model.ProvGeneration,
                 {
-                    str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                    str(
-                        prov.model.PROV_ROLE
-                    ): ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_PIPELINE_VERSION_REVISION,
                 },
             )
 
+            # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
+            self.context.add_element(pipeline_version_revision.pipeline_version)
+            self.context.add_relation(
+                pipeline_version_revision,
+                pipeline_version_revision.pipeline_version,
+                prov.model.ProvSpecialization,
+            )
+            if self.parent_pipeline_version_revision:
+                self.context.add_element(self.parent_pipeline_version_revision)
+                self.context.add_relation(
+                    pipeline_version_revision,
+                    self.parent_pipeline_version_revision,
+                    ProvRevision,
+                )
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_version_revision,
+                    prov.model.ProvUsage,
+                    {
+                        _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                        _PROV_ROLE_STR: ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    },
+                )
+
         return self.context.document
 
 
@@ -383,118 +529,113 @@ class OperatorModificationModel(Model):
     parent_pipeline_version_revision: PipelineVersionRevision | None
 
     def build(self) -> prov.model.ProvDocument:
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        self.context.add_element(self.pipeline_change)
-        if self.parent_pipeline_change:
-            self.context.add_element(self.parent_pipeline_change)
-            self.context.add_relation(
-                self.pipeline_change,
-                self.parent_pipeline_change,
-                prov.model.ProvCommunication,
-            )
+        with self.context.batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            self.context.add_element(self.pipeline_change)
+            if self.parent_pipeline_change:
+                self.context.add_element(self.parent_pipeline_change)
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_change,
+                    prov.model.ProvCommunication,
+                )
 
-        # Add modified `Operator`, new `OperatorRevision`, parent `OperatorRevision` and relations
-        operator_revision = self.pipeline_change.operator_revision
-        self.context.add_element(operator_revision)
-        self.context.add_relation(
-            operator_revision,
-            self.pipeline_change,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.MODIFIED_OPERATOR,
-            },
-        )
-        if self.parent_operator_revision:
-            self.context.add_element(self.parent_operator_revision)
+            # Add modified `Operator`, new `OperatorRevision`, parent `OperatorRevision` and relations
+            operator_revision = self.pipeline_change.operator_revision
+            self.context.add_element(operator_revision)
             self.context.add_relation(
                 operator_revision,
-                self.parent_operator_revision,
-                ProvRevision,
-            )
-            self.context.add_relation(
                 self.pipeline_change,
-                self.parent_operator_revision,
-                prov.model.ProvUsage,
+                prov.model.ProvGeneration,
                 {
-                    str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                    str(prov.model.PROV_ROLE): ProvRole.USED_PARENT_OPERATOR_REVISION,
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.MODIFIED_OPERATOR,
                 },
             )
-        operator = operator_revision.operator
-        self.context.add_element(operator)
-        self.context.add_relation(
-            operator_revision,
-            operator,
-            prov.model.ProvSpecialization,
-        )
-
-        # Add operator parameters and relations
-        for parameter in operator_revision.parameters:
-            self.context.add_element(parameter)
+            if self.parent_operator_revision:
+                self.context.add_element(self.parent_operator_revision)
+                self.context.add_relation(
+                    operator_revision,
+                    self.parent_operator_revision,
+                    ProvRevision,
+                )
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_operator_revision,
+                    prov.model.ProvUsage,
+                    {
+                        _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                        _PROV_ROLE_STR: ProvRole.USED_PARENT_OPERATOR_REVISION,
+                    },
+                )
+            operator = operator_revision.operator
+            self.context.add_element(operator)
             self.context.add_relation(
                 operator_revision,
-                parameter,
-                prov.model.ProvMembership,
+                operator,
+                prov.model.ProvSpecialization,
             )
 
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = self.pipeline_change.pipeline_version_revision
-        self.context.add_element(pipeline_version_revision)
-        for operator_revision in pipeline_version_revision.operators:
-            self.context.add_element(
-                operator_revision,
+            # Add operator parameters and relations
+            for parameter in operator_revision.parameters:
+                self.context.add_element(parameter)
+            self.context.add_members_bulk(
+                operator_revision, operator_revision.parameters
             )
-            self.context.add_relation(
+
+            # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
+            pipeline_version_revision = self.pipeline_change.pipeline_version_revision
+            self.context.add_element(pipeline_version_revision)
+            for operator_revision in pipeline_version_revision.operators:
+                self.context.add_element(
+                    operator_revision,
+                )
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                operator_revision,
-                prov.model.ProvMembership,
-            )
-        for connection in pipeline_version_revision.connections:
-            self.context.add_element(
-                connection,
+                pipeline_version_revision.operators,
             )
-            self.context.add_relation(
+            for connection in pipeline_version_revision.connections:
+                self.context.add_element(
+                    connection,
+                )
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                connection,
-                prov.model.ProvMembership,
+                pipeline_version_revision.connections,
             )
-        self.context.add_relation(
-            pipeline_version_revision,
-            self.pipeline_change,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_PIPELINE_VERSION_REVISION,
-            },
-        )
-
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        self.context.add_element(pipeline_version_revision.pipeline_version)
-        self.context.add_relation(
-            pipeline_version_revision,
-            pipeline_version_revision.pipeline_version,
-            prov.model.ProvSpecialization,
-        )
-        if self.parent_pipeline_version_revision:
-            self.context.add_element(self.parent_pipeline_version_revision)
             self.context.add_relation(
                 pipeline_version_revision,
-                self.parent_pipeline_version_revision,
-                ProvRevision,
-            )
-            self.context.add_relation(
                 self.pipeline_change,
-                self.parent_pipeline_version_revision,
-                prov.model.ProvUsage,
+                prov.model.ProvGeneration,
                 {
-                    str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                    str(
-                        prov.model.PROV_ROLE
-                    ): ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_PIPELINE_VERSION_REVISION,
                 },
             )
 
+            # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
+            self.context.add_element(pipeline_version_revision.pipeline_version)
+            self.context.add_relation(
+                pipeline_version_revision,
+                pipeline_version_revision.pipeline_version,
+                prov.model.ProvSpecialization,
+            )
+            if self.parent_pipeline_version_revision:
+                self.context.add_element(self.parent_pipeline_version_revision)
+                self.context.add_relation(
+                    pipeline_version_revision,
+                    self.parent_pipeline_version_revision,
+                    ProvRevision,
+                )
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_version_revision,
+                    prov.model.ProvUsage,
+                    {
+                        _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                        _PROV_ROLE_STR: ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    },
+                )
+
         return self.context.document
 
 
@@ -514,93 +655,90 @@ class OperatorDeletionModel(Model):
     parent_pipeline_version_revision: PipelineVersionRevision | None
 
     def build(self) -> prov.model.ProvDocument:
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        self.context.add_element(self.pipeline_change)
-        if self.parent_pipeline_change:
-            self.context.add_element(self.parent_pipeline_change)
-            self.context.add_relation(
-                self.pipeline_change,
-                self.parent_pipeline_change,
-                prov.model.ProvCommunication,
-            )
-
-        # Add deleted `Operator`, corresponding `OperatorRevision`, and relations
-        operator_revision = self.pipeline_change.operator_revision
-        self.context.add_element(operator_revision)
-        self.context.add_relation(
-            operator_revision,
-            self.pipeline_change,
-            prov.model.ProvInvalidation,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.DELETED_OPERATOR,
-            },
-        )
-        operator = operator_revision.operator
-        self.context.add_element(operator)
-        self.context.add_relation(
-            operator_revision,
-            operator,
-            prov.model.ProvSpecialization,
-        )
+        with self.context.batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            self.context.add_element(self.pipeline_change)
+            if self.parent_pipeline_change:
+                self.context.add_element(self.parent_pipeline_change)
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_change,
+                    prov.model.ProvCommunication,
+                )
 
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = self.pipeline_change.pipeline_version_revision
-        self.context.add_element(pipeline_version_revision)
-        for operator_revision in pipeline_version_revision.operators:
-            self.context.add_element(
+            # Add deleted `Operator`, corresponding `OperatorRevision`, and relations
+            operator_revision = self.pipeline_change.operator_revision
+            self.context.add_element(operator_revision)
+            self.context.add_relation(
                 operator_revision,
+                self.pipeline_change,
+                prov.model.ProvInvalidation,
+                {
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.DELETED_OPERATOR,
+                },
             )
+            operator = operator_revision.operator
+            self.context.add_element(operator)
             self.context.add_relation(
-                pipeline_version_revision,
                 operator_revision,
-                prov.model.ProvMembership,
-            )
-        for connection in pipeline_version_revision.connections:
-            self.context.add_element(
-                connection,
+                operator,
+                prov.model.ProvSpecialization,
             )
-            self.context.add_relation(
+
+            # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
+            pipeline_version_revision = self.pipeline_change.pipeline_version_revision
+            self.context.add_element(pipeline_version_revision)
+            for operator_revision in pipeline_version_revision.operators:
+                self.context.add_element(
+                    operator_revision,
+                )
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                connection,
-                prov.model.ProvMembership,
+                pipeline_version_revision.operators,
             )
-        self.context.add_relation(
-            pipeline_version_revision,
-            self.pipeline_change,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_PIPELINE_VERSION_REVISION,
-            },
-        )
-
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        self.context.add_element(pipeline_version_revision.pipeline_version)
-        self.context.add_relation(
-            pipeline_version_revision,
-            pipeline_version_revision.pipeline_version,
-            prov.model.ProvSpecialization,
-        )
-        if self.parent_pipeline_version_revision:
-            self.context.add_element(self.parent_pipeline_version_revision)
-            self.context.add_relation(
+            for connection in pipeline_version_revision.connections:
+                self.context.add_element(
+                    connection,
+                )
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                self.parent_pipeline_version_revision,
-                ProvRevision,
+                pipeline_version_revision.connections,
             )
             self.context.add_relation(
+                pipeline_version_revision,
                 self.pipeline_change,
-                self.parent_pipeline_version_revision,
-                prov.model.ProvUsage,
+                prov.model.ProvGeneration,
                 {
-                    str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                    str(
-                        prov.model.PROV_ROLE
-                    ): ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_PIPELINE_VERSION_REVISION,
                 },
             )
 
+            # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
+            self.context.add_element(pipeline_version_revision.pipeline_version)
+            self.context.add_relation(
+                pipeline_version_revision,
+                pipeline_version_revision.pipeline_version,
+                prov.model.ProvSpecialization,
+            )
+            if self.parent_pipeline_version_revision:
+                self.context.add_element(self.parent_pipeline_version_revision)
+                self.context.add_relation(
+                    pipeline_version_revision,
+                    self.parent_pipeline_version_revision,
+                    ProvRevision,
+                )
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_version_revision,
+                    prov.model.ProvUsage,
+                    {
+                        _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                        _PROV_ROLE_STR: ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    },
+                )
+
         return self.context.document
 
 
@@ -620,82 +758,79 @@ class ConnectionCreationModel(Model):
     parent_pipeline_version_revision: PipelineVersionRevision | None
 
     def build(self) -> prov.model.ProvDocument:
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        self.context.add_element(self.pipeline_change)
-        if self.parent_pipeline_change:
-            self.context.add_element(self.parent_pipeline_change)
+        with self.context.batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            self.context.add_element(self.pipeline_change)
+            if self.parent_pipeline_change:
+                self.context.add_element(self.parent_pipeline_change)
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_change,
+                    prov.model.ProvCommunication,
+                )
+
+            # Add created `Connection` and relation
+            connection = self.pipeline_change.connection
+            self.context.add_element(connection)
             self.context.add_relation(
+                connection,
                 self.pipeline_change,
-                self.parent_pipeline_change,
-                prov.model.ProvCommunication,
+                prov.model.ProvGeneration,
+                {
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_CONNECTION,
+                },
             )
 
-        # Add created `Connection` and relation
-        connection = self.pipeline_change.connection
-        self.context.add_element(connection)
-        self.context.add_relation(
-            connection,
-            self.pipeline_change,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_CONNECTION,
-            },
-        )
-
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = self.pipeline_change.pipeline_version_revision
-        self.context.add_element(pipeline_version_revision)
-        for operator_revision in pipeline_version_revision.operators:
-            self.context.add_element(operator_revision)
-            self.context.add_relation(
+            # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
+            pipeline_version_revision = self.pipeline_change.pipeline_version_revision
+            self.context.add_element(pipeline_version_revision)
+            for operator_revision in pipeline_version_revision.operators:
+                self.context.add_element(operator_revision)
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                operator_revision,
-                prov.model.ProvMembership,
+                pipeline_version_revision.operators,
             )
-        for connection in pipeline_version_revision.connections:
-            self.context.add_element(connection)
-            self.context.add_relation(
+            for connection in pipeline_version_revision.connections:
+                self.context.add_element(connection)
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                connection,
-                prov.model.ProvMembership,
+                pipeline_version_revision.connections,
             )
-        self.context.add_relation(
-            pipeline_version_revision,
-            self.pipeline_change,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_PIPELINE_VERSION_REVISION,
-            },
-        )
-
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        self.context.add_element(pipeline_version_revision.pipeline_version)
-        self.context.add_relation(
-            pipeline_version_revision,
-            pipeline_version_revision.pipeline_version,
-            prov.model.ProvSpecialization,
-        )
-        if self.parent_pipeline_version_revision:
-            self.context.add_element(self.parent_pipeline_version_revision)
             self.context.add_relation(
                 pipeline_version_revision,
-                self.parent_pipeline_version_revision,
-                ProvRevision,
-            )
-            self.context.add_relation(
                 self.pipeline_change,
-                self.parent_pipeline_version_revision,
-                prov.model.ProvUsage,
+                prov.model.ProvGeneration,
                 {
-                    str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                    str(
-                        prov.model.PROV_ROLE
-                    ): ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_PIPELINE_VERSION_REVISION,
                 },
             )
 
+            # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
+            self.context.add_element(pipeline_version_revision.pipeline_version)
+            self.context.add_relation(
+                pipeline_version_revision,
+                pipeline_version_revision.pipeline_version,
+                prov.model.ProvSpecialization,
+            )
+            if self.parent_pipeline_version_revision:
+                self.context.add_element(self.parent_pipeline_version_revision)
+                self.context.add_relation(
+                    pipeline_version_revision,
+                    self.parent_pipeline_version_revision,
+                    ProvRevision,
+                )
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_version_revision,
+                    prov.model.ProvUsage,
+                    {
+                        _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                        _PROV_ROLE_STR: ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    },
+                )
+
         return self.context.document
 
 
@@ -715,82 +850,79 @@ class ConnectionDeletionModel(Model):
     parent_pipeline_version_revision: PipelineVersionRevision | None
 
     def build(self) -> prov.model.ProvDocument:
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        self.context.add_element(self.pipeline_change)
-        if self.parent_pipeline_change:
-            self.context.add_element(self.parent_pipeline_change)
+        with self.context.batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            self.context.add_element(self.pipeline_change)
+            if self.parent_pipeline_change:
+                self.context.add_element(self.parent_pipeline_change)
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_change,
+                    prov.model.ProvCommunication,
+                )
+
+            # Add deleted `Connection` and relation
+            connection = self.pipeline_change.connection
+            self.context.add_element(connection)
             self.context.add_relation(
+                connection,
                 self.pipeline_change,
-                self.parent_pipeline_change,
-                prov.model.ProvCommunication,
+                prov.model.ProvInvalidation,
+                {
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.DELETED_CONNECTION,
+                },
             )
 
-        # Add deleted `Connection` and relation
-        connection = self.pipeline_change.connection
-        self.context.add_element(connection)
-        self.context.add_relation(
-            connection,
-            self.pipeline_change,
-            prov.model.ProvInvalidation,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.DELETED_CONNECTION,
-            },
-        )
-
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = self.pipeline_change.pipeline_version_revision
-        self.context.add_element(pipeline_version_revision)
-        for operator_revision in pipeline_version_revision.operators:
-            self.context.add_element(operator_revision)
-            self.context.add_relation(
+            # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
+            pipeline_version_revision = self.pipeline_change.pipeline_version_revision
+            self.context.add_element(pipeline_version_revision)
+            for operator_revision in pipeline_version_revision.operators:
+                self.context.add_element(operator_revision)
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                operator_revision,
-                prov.model.ProvMembership,
+                pipeline_version_revision.operators,
             )
-        for connection in pipeline_version_revision.connections:
-            self.context.add_element(connection)
-            self.context.add_relation(
+            for connection in pipeline_version_revision.connections:
+                self.context.add_element(connection)
+            self.context.add_members_bulk(
                 pipeline_version_revision,
-                connection,
-                prov.model.ProvMembership,
+                pipeline_version_revision.connections,
             )
-        self.context.add_relation(
-            pipeline_version_revision,
-            self.pipeline_change,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_PIPELINE_VERSION_REVISION,
-            },
-        )
-
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        self.context.add_element(pipeline_version_revision.pipeline_version)
-        self.context.add_relation(
-            pipeline_version_revision,
-            pipeline_version_revision.pipeline_version,
-            prov.model.ProvSpecialization,
-        )
-        if self.parent_pipeline_version_revision:
-            self.context.add_element(self.parent_pipeline_version_revision)
             self.context.add_relation(
                 pipeline_version_revision,
-                self.parent_pipeline_version_revision,
-                ProvRevision,
-            )
-            self.context.add_relation(
                 self.pipeline_change,
-                self.parent_pipeline_version_revision,
-                prov.model.ProvUsage,
+                prov.model.ProvGeneration,
                 {
-                    str(prov.model.PROV_ATTR_TIME): self.pipeline_change.time,
-                    str(
-                        prov.model.PROV_ROLE
-                    ): ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_PIPELINE_VERSION_REVISION,
                 },
             )
 
+            # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
+            self.context.add_element(pipeline_version_revision.pipeline_version)
+            self.context.add_relation(
+                pipeline_version_revision,
+                pipeline_version_revision.pipeline_version,
+                prov.model.ProvSpecialization,
+            )
+            if self.parent_pipeline_version_revision:
+                self.context.add_element(self.parent_pipeline_version_revision)
+                self.context.add_relation(
+                    pipeline_version_revision,
+                    self.parent_pipeline_version_revision,
+                    ProvRevision,
+                )
+                self.context.add_relation(
+                    self.pipeline_change,
+                    self.parent_pipeline_version_revision,
+                    prov.model.ProvUsage,
+                    {
+                        _PROV_ATTR_TIME_STR: self.pipeline_change.time,
+                        _PROV_ROLE_STR: ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
+                    },
+                )
+
         return self.context.document
 
 
@@ -806,53 +938,44 @@ class OperationExecutionModel(Model):
     operator_execution: OperatorExecution
 
     def build(self) -> prov.model.ProvDocument:
-        # Add `OperatorExecution`, `OperatorRevision`, and relation
-        self.context.add_element(self.operator_execution)
-        operator_revision = self.operator_execution.operator_revision
-        # Add operator parameters and relations
-        for parameter in operator_revision.parameters:
-            self.context.add_element(parameter)
+        with self.context.batch():
+            # Add `OperatorExecution`, `OperatorRevision`, and relation
+            self.context.add_element(self.operator_execution)
+            operator_revision = self.operator_execution.operator_revision
+            # Add operator parameters and relations
+            for parameter in operator_revision.parameters:
+                self.context.add_element(parameter)
+            self.context.add_members_bulk(
+                operator_revision, operator_revision.parameters
+            )
+            self.context.add_element(operator_revision)
             self.context.add_relation(
+                self.operator_execution,
                 operator_revision,
-                parameter,
-                prov.model.ProvMembership,
-            )
-        self.context.add_element(operator_revision)
-        self.context.add_relation(
-            self.operator_execution,
-            operator_revision,
-            prov.model.ProvUsage,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.operator_execution.time,
-                str(prov.model.PROV_ROLE): ProvRole.USED_OPERATOR_REVISION,
-            },
-        )
-
-        # Add `OperatorRun` and relation
-        operator_run = self.operator_execution.operator_run
-        self.context.add_element(operator_run)
-        self.context.add_relation(
-            operator_run,
-            self.operator_execution,
-            prov.model.ProvGeneration,
-            {
-                str(prov.model.PROV_ATTR_TIME): self.operator_execution.time,
-                str(prov.model.PROV_ROLE): ProvRole.CREATED_OPERATOR_RUN,
-            },
-        )
+                prov.model.ProvUsage,
+                {
+                    _PROV_ATTR_TIME_STR: self.operator_execution.time,
+                    _PROV_ROLE_STR: ProvRole.USED_OPERATOR_REVISION,
+                },
+            )
 
-        # Add `Metric`s and relations
-        for metric in operator_run.metrics:
-            self.context.add_element(metric)
+            # Add `OperatorRun` and relation
+            operator_run = self.operator_execution.operator_run
+            self.context.add_element(operator_run)
             self.context.add_relation(
                 operator_run,
-                metric,
-                prov.model.ProvMembership,
-            )
-            self.context.add_relation(
-                operator_revision,
-                metric,
-                prov.model.ProvMembership,
+                self.operator_execution,
+                prov.model.ProvGeneration,
+                {
+                    _PROV_ATTR_TIME_STR: self.operator_execution.time,
+                    _PROV_ROLE_STR: ProvRole.CREATED_OPERATOR_RUN,
+                },
             )
 
+            # Add `Metric`s and relations
+            for metric in operator_run.metrics:
+                self.context.add_element(metric)
+            self.context.add_members_bulk(operator_run, operator_run.metrics)
+            self.context.add_members_bulk(operator_revision, operator_run.metrics)
+
         return self.context.document
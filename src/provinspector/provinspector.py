@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Iterable, Iterator
 from uuid import uuid4
 from warnings import warn
 
@@ -98,10 +99,12 @@ class ProvInspector:
 
     def initialize(
         self,
-        data: list[PipelineChangeData],
+        data: Iterable[PipelineChangeData],
     ) -> None:
         """
         Initialize provenance graph from initial pipeline change data.
+
+        The data is consumed in a single pass, so it may be a generator streaming straight from a dump file.
         """
 
         if not self.initialized:
@@ -654,11 +657,15 @@ class ProvInspector:
     def query(
         self,
         query: str,
-    ) -> Cursor:
+    ) -> Iterator:
         """
-        Query provenance graph.
+        Query provenance graph, yielding one result record at a time.
+
+        The records are forwarded straight from the underlying cursor, so consumers stream from the Bolt connection instead of materializing the full result.
         """
 
-        return self.provenance_database.adapter.graph.run(
+        cursor: Cursor = self.provenance_database.adapter.graph.run(
             cypher=query,
         )
+
+        yield from cursor
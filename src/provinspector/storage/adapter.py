@@ -4,6 +4,7 @@ from enum import Enum
 from typing import Any
 
 from docker import DockerClient
+from docker.errors import NotFound
 from docker.models.containers import Container
 from py2neo import Graph
 
@@ -47,13 +48,13 @@ class Adapter:
 
     def disconnect(self):
         """
-        Disconnect from a Neo4J database.
+        Disconnect from a Neo4J database. Disconnecting twice is a no-op.
         """
 
-        if self.graph is None:
+        if getattr(self, "graph", None) is None:
             return
 
-        del self.graph
+        self.graph = None  # type: ignore
 
     def shutdown(self):
         raise NotImplementedError
@@ -65,18 +66,40 @@ def start_docker_container(
     environment: list[str],
     name: str,
     image: str,
+    tmpfs: dict[str, str] | None = None,
+    mem_limit: str | None = None,
+    ulimits: list[Any] | None = None,
 ) -> tuple[DockerClient, Container]:
     # Initialize Docker client
     docker_client = DockerClient(base_url=docker_socket)
 
+    # Reuse an already running container of the same name to avoid the container create/destroy overhead
+    try:
+        container: Container = docker_client.containers.get(name)  # type:ignore
+        if container.status == "running":
+            return docker_client, container
+        container.remove(force=True)
+    except NotFound:
+        pass
+
+    # Collect optional keyword arguments
+    kwargs: dict[str, Any] = {}
+    if tmpfs is not None:
+        kwargs["tmpfs"] = tmpfs
+    if mem_limit is not None:
+        kwargs["mem_limit"] = mem_limit
+    if ulimits is not None:
+        kwargs["ulimits"] = ulimits
+
     # Run Docker container
-    container: Container = docker_client.containers.run(
+    container = docker_client.containers.run(
         remove=True,
         detach=True,
         ports=ports,
         environment=environment,
         name=name,
         image=image,
+        **kwargs,
     )  # type:ignore
 
     return docker_client, container
@@ -115,7 +138,8 @@ class Neo4JAdapter(Adapter):
                 raise Exception("Error starting container")
 
         # Set default database name
-        self.database_name = "neo4j"
+        if self.database_name is None:
+            self.database_name = "neo4j"
 
         # Establish database connection
         self.connect(
@@ -125,6 +149,10 @@ class Neo4JAdapter(Adapter):
         )
 
     def shutdown(self):
+        # A second shutdown is a no-op
+        if getattr(self, "graph", None) is None:
+            return
+
         # Remove database connection
         self.disconnect()
 
@@ -172,6 +200,10 @@ class MemgraphAdapter(Adapter):
         )
 
     def shutdown(self):
+        # A second shutdown is a no-op
+        if getattr(self, "graph", None) is None:
+            return
+
         # Remove database connection
         self.disconnect()
 
@@ -1,4 +1,4 @@
-from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from typing import Any
@@ -16,7 +16,7 @@ from prov.model import (
     ProvEntity,
     ProvRelation,
 )
-from py2neo import Graph, Node, Relationship, Subgraph
+from py2neo import Graph
 
 from provinspector.storage.adapter import Adapter, Neo4JAdapter
 
@@ -34,6 +34,9 @@ PROVINSPECTOR_BUNDLED_IN = "provinspector:bundledIn"
 PROVINSPECTOR_NODE = (PROVINSPECTOR_LABEL, "provinspector:node")
 PROVINSPECTOR_EDGE = (PROVINSPECTOR_LABEL, "provinspector:edge")
 
+# Sentinel for absent dict entries
+_MISSING = object()
+
 # Constant mappings
 EDGE_LABELS = PROV_N_MAP
 NODE_LABELS = {
@@ -171,14 +174,66 @@ def encode_graph(
     graph: ProvDocument,
 ):
     """
-    Encode a PROV graph (ProvDocument) as a collection of py2neo Nodes and Relationships (Subgraph).
+    Encode a PROV graph (ProvDocument) as plain node and edge parameter dicts.
+
+    The returned tuple contains a mapping from node id to node dict and a list of edge dicts. Both are consumed directly as Cypher query parameters by `ProvGraphDatabase.import_graph`, so no intermediate py2neo objects are allocated.
     """
 
     nodes = encode_nodes(graph)
-    edges = encode_edges(graph, nodes)
-    edges.extend(encode_bundle_edges(graph, nodes))
+    edges = encode_edges(graph)
+    edges.extend(encode_bundle_edges(graph))
+
+    return nodes, edges
+
+
+@dataclass
+class StagedProvGraph:
+    """
+    A PROV graph staged for import as columnar parameter rows.
+
+    Node rows are grouped by their label set and edge rows by their label, so each group maps onto exactly one parameterized `UNWIND` query and no per-record objects survive past encoding.
+
+    Attributes:
+        `node_groups`
+        `edge_groups`
+    """
+
+    node_groups: dict[tuple, list[dict]] = field(default_factory=dict)
+    edge_groups: dict[str, list[dict]] = field(default_factory=dict)
 
-    return Subgraph(nodes.values(), edges)
+
+def stage_graph(
+    graph: ProvDocument,
+) -> StagedProvGraph:
+    """
+    Encode a PROV graph and group the node and edge rows into a `StagedProvGraph`.
+    """
+
+    nodes, edges = encode_graph(graph)
+    staged = StagedProvGraph()
+
+    # `provinspector:node` acts as primary label for merge and is set by the
+    # merge query itself, so it is dropped from the grouping key
+    primary_label = PROVINSPECTOR_NODE[1]
+
+    for node_id, node in nodes.items():
+        labels = tuple(
+            sorted(label for label in node["labels"] if label != primary_label)
+        )
+        staged.node_groups.setdefault(labels, []).append(
+            {"id": node_id, "properties": node["properties"]}
+        )
+
+    for edge in edges:
+        staged.edge_groups.setdefault(edge["label"], []).append(
+            {
+                "source": edge["source"],
+                "target": edge["target"],
+                "properties": edge["properties"],
+            }
+        )
+
+    return staged
 
 
 def get_graph_nodes(
@@ -187,23 +242,19 @@ def get_graph_nodes(
     """
     Return a list containing the nodes of a PROV graph.
 
-    Explore the graph using BFS level by level. Expand bundles and add bundle nodes to the queue. A deque is used as queue.
+    Collect the top-level elements first, then explore the bundles with a worklist, expanding nested bundles as they are encountered. Node order does not matter for the encoding.
 
     Bundles are included in the returned nodes. Notice that while not all bundles are PROV elements the ones that are are PROV entities. Most of the time, the declaration for the entity part and the bundle part are stored in two different PROV elements.
     """
 
-    nodes = []
-    q = deque([graph.get_records(ProvElement), graph.bundles])
-
-    while q:
-        current_bfs_level = q.popleft()
-
-        for item in current_bfs_level:
-            nodes.append(item)
+    nodes = list(graph.get_records(ProvElement))
+    worklist = list(graph.bundles)
 
-            if type(item) is ProvBundle:
-                q.append(item.get_records(ProvElement))
-                q.append(list(item.bundles))
+    while worklist:
+        bundle = worklist.pop()
+        nodes.append(bundle)
+        nodes.extend(bundle.get_records(ProvElement))
+        worklist.extend(bundle.bundles)
 
     return nodes
 
@@ -212,21 +263,26 @@ def get_graph_edges(
     graph: ProvDocument,
 ):
     """
-    Return a list containing the edges of a PROV graph.
+    Yield the edges of a PROV graph.
 
-    Flatten the graph and return its records filtered for edges (ProvRelations).
+    Yield the top-level relations first, then explore the bundles with a worklist, expanding nested bundles as they are encountered. The edges are streamed instead of flattening the graph, which would copy every record into a new document.
     """
 
-    flattened = graph.flattened()
+    yield from graph.get_records(ProvRelation)
 
-    return list(flattened.get_records(class_or_type_or_tuple=ProvRelation))
+    worklist = list(graph.bundles)
+
+    while worklist:
+        bundle = worklist.pop()
+        yield from bundle.get_records(ProvRelation)
+        worklist.extend(bundle.bundles)
 
 
 def encode_nodes(
     graph: ProvDocument,
 ):
     """
-    Encode the nodes of a PROV graph as py2neo Nodes. Return a mapping from node id to py2neo Node.
+    Encode the nodes of a PROV graph as parameter dicts. Return a mapping from node id to a dict with the node labels and properties.
 
     Create a NodePropertySet for each PROV type contained in the list of nodes provided by `get_graph_nodes`.
 
@@ -235,7 +291,7 @@ def encode_nodes(
         - From: (Node) -{relation}-> Literal
         - To: (Node {relation: Literal})
 
-    Finally, the computed NodePropertySets are cast to py2neo nodes using the `to_py2neo_node` function before returning the mapping from node ids to py2neo nodes.
+    Finally, the computed NodePropertySets are converted to `{"labels": [...], "properties": {...}}` dicts before returning the mapping from node ids to node dicts.
     """
 
     nodes = {}
@@ -265,9 +321,19 @@ def encode_nodes(
         if target_id not in nodes:
             nodes[target_id] = NodePropertySet(qualified_name=target)
 
-    # Convert property sets to py2neo nodes
+    # Convert property sets to node dicts
     for node_id, node_property_set in list(nodes.items()):
-        nodes[node_id] = to_py2neo_node(node_property_set)
+        property_dict = to_property_dict(node_property_set)
+
+        # Node labels are the values stored at the key PROVINSPECTOR_LABEL
+        labels = property_dict.pop(PROVINSPECTOR_LABEL, [])
+        if type(labels) is not list:
+            labels = [labels]
+
+        nodes[node_id] = {
+            "labels": labels,
+            "properties": property_dict,
+        }
 
     return nodes
 
@@ -277,65 +343,35 @@ def to_property_dict(
 ):
     """
     Turn a property set into a dict of properties.
-    """
-
-    # Encode the set of properties
-    encoded_property_set = [tuple(map(encode_value, item)) for item in property_set]
 
-    # Count the occurence of each property key
-    key_count = Counter(key for key, _ in encoded_property_set)
-
-    property_dict = defaultdict(list)
+    A property is single-valued iff its key occurs only once; the values of a multi-valued property are stored in a list. The promotion from single value to value list happens incrementally on the second occurrence of a key, so no separate key counting pass is needed.
+    """
 
-    for key, value in encoded_property_set:
-        # Property is single-valued iff the property key occurs only once
-        if key_count.get(key) == 1:
-            property_dict[key] = value  # type:ignore
+    property_dict = {}
 
-        # Property is multi-valued iff the property key occurs more than once
+    for key, value in property_set:
+        key, value = encode_value(key), encode_value(value)
+        previous = property_dict.get(key, _MISSING)
 
-        # Values of a multi-valued property are stored in a list
+        if previous is _MISSING:
+            property_dict[key] = value
+        elif type(previous) is list:
+            previous.append(value)
         else:
-            property_dict[key].append(value)
+            property_dict[key] = [previous, value]
 
     return property_dict
 
 
-def to_py2neo_node(
-    property_set: set,
-):
-    """
-    Turn a property set into a py2neo Node.
-
-    First convert the property set into a property dict. Then extract the node labels from the dict. Node labels are the values stored at the key `prov:type`.
-    """
-
-    property_dict = to_property_dict(property_set)
-
-    # Get node labels, key PROVINSPECTOR_LABEL
-    labels = property_dict[PROVINSPECTOR_LABEL]
-
-    # Delete the key PROVINSPECTOR_LABEL
-    del property_dict[PROVINSPECTOR_LABEL]
-
-    if type(labels) is not list:
-        return Node(labels, **property_dict)
-
-    return Node(*labels, **property_dict)
-
-
 def encode_edges(
     graph: ProvDocument,
-    nodes: dict,
 ):
     """
-    Encode the edges of a PROV graph as py2neo Relationships (edges). Returns a list of py2neo Relationships.
+    Encode the edges of a PROV graph as parameter dicts. Returns a list of edge dicts.
 
-    Encode the attributes of each edge as an EdgePropertySet. Turn the property set into a property dict. Create the py2neo relationship and add it to the list of edges.
+    Encode the attributes of each edge as an EdgePropertySet. Turn the property set into a property dict. Create the edge dict with source and target node ids, edge label, and properties, and add it to the list of edges.
 
     Ignore/skip edges that connect a node to a literal, as these have been handled in the node encoding already.
-
-    Use the provided mapping from node ids to py2neo Nodes as a lookup for source and target nodes of each created edge.
     """
 
     edges = []
@@ -345,30 +381,33 @@ def encode_edges(
         (_, target) = edge.formal_attributes[1]
 
         if type(target) is QualifiedName:
-            source = nodes[str_id(source)]
-            target = nodes[str_id(target)]
-
-            label = edge_label(edge)
             properties = EdgePropertySet(edge)
-            encoded_properties = to_property_dict(properties)
 
-            relation = Relationship(source, label, target, **encoded_properties)
-            edges.append(relation)
+            edges.append(
+                {
+                    "source": str_id(source),
+                    "target": str_id(target),
+                    "label": edge_label(edge),
+                    "properties": to_property_dict(properties),
+                }
+            )
 
     return edges
 
 
 def encode_bundle_edges(
     graph: ProvDocument,
-    nodes: dict,
 ):
     """
     Return a list of `bundledIn` edges between each bundle node and the nodes included within the bundle.
 
     If a node (A) is included in a bundle that is encoded in node (B), a relationship/edge of type `bundledIn` is created between the two. This allows to retrieve the nodes that are included in a specific bundle with a simple cypher query.
+
+    Bundle identifier strings are computed once per bundle and cached, as every node of a bundle shares the same target id.
     """
 
     edges = []
+    bundle_ids: dict[int, str] = {}
 
     for node in get_graph_nodes(graph):
         # Skip bundles as ProvBundle.bundle would raise an AttributeError
@@ -377,14 +416,20 @@ def encode_bundle_edges(
             continue
 
         if type(node.bundle) is ProvBundle:
-            n_id = str_id(node.identifier)
-            b_id = str_id(node.bundle.identifier)  # type:ignore
-
-            source = nodes[n_id]
-            target = nodes[b_id]
-
-            relation = Relationship(source, PROVINSPECTOR_BUNDLED_IN, target)
-            edges.append(relation)
+            bundle = node.bundle
+            target_id = bundle_ids.get(id(bundle))
+            if target_id is None:
+                target_id = str_id(bundle.identifier)  # type:ignore
+                bundle_ids[id(bundle)] = target_id
+
+            edges.append(
+                {
+                    "source": str_id(node.identifier),
+                    "target": target_id,
+                    "label": PROVINSPECTOR_BUNDLED_IN,
+                    "properties": {},
+                }
+            )
 
     return edges
 
@@ -424,43 +469,118 @@ def add_id_uniqueness_constraints(
 
 @dataclass
 class ProvGraphDatabase:
+    """
+    A provenance graph database backed by a Neo4J (py2neo) adapter.
+
+    With `max_workers` greater than zero, imports are submitted to a bounded thread pool sharing the py2neo connection pool, so independent updates overlap their Bolt round trips. Concurrent imports may interleave, so the pool should only be enabled when the imported graphs do not depend on each other's records; the default stays sequential.
+
+    Attributes:
+        `adapter`
+        `max_workers`
+    """
+
     adapter: Adapter = field(default_factory=Neo4JAdapter)
+    max_workers: int = 0
+    _executor: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
+    _pending: list[Future] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self):
         # Add uniqueness constraints
         add_id_uniqueness_constraints(self.adapter.graph)
 
+        if self.max_workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
     def shutdown(self) -> None:
+        if self._executor is not None:
+            self.drain()
+            self._executor.shutdown()
+            self._executor = None
+
         self.adapter.shutdown()
 
+    def drain(self) -> None:
+        """
+        Wait for all queued imports to finish, surfacing the first failure.
+        """
+
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
     def import_graph(self, graph: ProvDocument) -> None:
         """
         Import a PROV graph into a graph database.
+
+        The encoded node and edge dicts are grouped by label and merged with one parameterized `UNWIND` query per group, so the number of statements is bounded by the number of distinct labels instead of the number of records. The graph is staged on the calling thread; with a worker pool enabled, only the merge transaction runs asynchronously.
         """
 
         if self.adapter.graph is None:
             return
 
-        # Encode graph as py2neo Subgraph
-        encoded_graph = encode_graph(graph)
+        # Stage graph as grouped node and edge parameter rows
+        staged = stage_graph(graph)
 
-        # Node identifier acts as primary key for merge
-        primary_key = PROVINSPECTOR_ID
-        # `provinspector:node` acts as primary label for merge
-        primary_label = PROVINSPECTOR_NODE[1]
+        if self._executor is None:
+            self._import_staged(staged)
+        else:
+            self._pending.append(self._executor.submit(self._import_staged, staged))
 
+    def _import_staged(self, staged: StagedProvGraph) -> None:
         tx = self.adapter.graph.begin()
 
-        # Merge all nodes and edge, merge updates already existing nodes, and create new ones if necessary
-        tx.merge(encoded_graph, primary_label=primary_label, primary_key=primary_key)
+        # Merge all nodes and edges, merge updates already existing nodes, and creates new ones if necessary
+        for labels, rows in staged.node_groups.items():
+            self.bulk_merge_nodes(tx, labels, rows)
+
+        for label, rows in staged.edge_groups.items():
+            self.bulk_merge_edges(tx, label, rows)
 
         self.adapter.graph.commit(tx)
 
+    @staticmethod
+    def bulk_merge_nodes(tx, labels: tuple, rows: list[dict]) -> None:
+        """
+        Merge all node rows of one label set with a single parameterized `UNWIND` query.
+        """
+
+        primary_key = PROVINSPECTOR_ID
+        primary_label = PROVINSPECTOR_NODE[1]
+
+        label_expr = "".join(f" SET n:`{label}`" for label in labels)
+        tx.run(
+            f"UNWIND $rows AS row "
+            f"MERGE (n:`{primary_label}` {{`{primary_key}`: row.id}}) "
+            f"SET n += row.properties{label_expr}",
+            rows=rows,
+        )
+
+    @staticmethod
+    def bulk_merge_edges(tx, label: str, rows: list[dict]) -> None:
+        """
+        Merge all edge rows of one label with a single parameterized `UNWIND` query.
+        """
+
+        primary_key = PROVINSPECTOR_ID
+        primary_label = PROVINSPECTOR_NODE[1]
+
+        tx.run(
+            f"UNWIND $rows AS row "
+            f"MATCH (a:`{primary_label}` {{`{primary_key}`: row.source}}) "
+            f"MATCH (b:`{primary_label}` {{`{primary_key}`: row.target}}) "
+            f"MERGE (a)-[r:`{label}`]->(b) "
+            f"SET r += row.properties",
+            rows=rows,
+        )
+
     def clear(self) -> None:
         """
         Clear database.
         """
 
+        if self._executor is not None:
+            self.drain()
+
         if self.adapter.graph is None:
             return
 
@@ -7,25 +7,48 @@ R = TypeVar("R")
 
 @dataclass
 class InMemoryRepository:
-    repo = defaultdict(list)
+    repo = defaultdict(dict)
+
+    @staticmethod
+    def key_attribute(resource_type: Type[R]) -> str:
+        """
+        Return the attribute that uniquely identifies resources of a type.
+        """
+
+        return "uuid" if hasattr(resource_type, "uuid") else "id_"
 
     def add(self, resource: R) -> None:  # type: ignore
-        self.repo[type(resource)].append(resource)
+        resource_type = type(resource)
+        key = getattr(resource, self.key_attribute(resource_type))
+        self.repo[resource_type][key] = resource
 
     def get(self, resource_type: Type[R], **filters: Any) -> R | None:
+        resources = self.repo.get(resource_type)
+        if not resources:
+            return None
+
+        # Lookups by the key attribute alone resolve without a scan
+        key_attribute = self.key_attribute(resource_type)
+        if set(filters) == {key_attribute}:
+            return resources.get(filters[key_attribute])
+
         return next(
             (
                 r
-                for r in self.repo.get(resource_type, [])
+                for r in resources.values()
                 if all(getattr(r, key) == val for key, val in filters.items())
             ),
             None,
         )
 
     def list_all(self, resource_type: Type[R], **filters: Any) -> list[R]:
+        resources = self.repo.get(resource_type)
+        if not resources:
+            return []
+
         return [
             r
-            for r in self.repo.get(resource_type, [])
+            for r in resources.values()
             if all(getattr(r, key) == val for key, val in filters.items())
         ]
 
@@ -1,3 +1,4 @@
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,6 +16,79 @@ from provinspector.data import (
 )
 from provinspector.domain.constants import OperatorStepType, PipelineChangeType
 
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - optional C-level parser
+    loads = json.loads
+
+
+@functools.singledispatch
+def to_dict(data: PipelineChangeData) -> dict:  # type:ignore
+    """
+    Turn pipeline change data into a dict, dispatching on the concrete data type.
+    """
+
+
+@to_dict.register
+def _(data: OperatorCreationPipelineChangeData) -> dict:
+    return {
+        "uniqueID": data.id,
+        "updateType": data.change_type.name,
+        "opID": data.operator_id,
+        "opName": data.operator_name,
+        "opData": data.operator_data,
+    }
+
+
+@to_dict.register
+def _(data: OperatorModificationPipelineChangeData) -> dict:
+    return {
+        "uniqueID": data.id,
+        "updateType": data.change_type.name,
+        "opID": data.operator_id,
+        "opName": data.operator_name,
+        "changedParam": data.changed_parameter,
+        "changedVal": data.changed_value,
+    }
+
+
+@to_dict.register
+def _(data: OperatorDeletionPipelineChangeData) -> dict:
+    return {
+        "uniqueID": data.id,
+        "updateType": data.change_type.name,
+        "opID": data.operator_id,
+        "opName": data.operator_name,
+    }
+
+
+@to_dict.register
+def _(data: ConnectionCreationPipelineChangeData) -> dict:
+    return {
+        "uniqueID": data.id,
+        "updateType": data.change_type.name,
+        "conID": data.connection_id,
+        "fromOpID": data.from_operator_id,
+        "toOpID": data.to_operator_id,
+        "fromSockID": data.from_socket_id,
+        "toSockID": data.to_socket_id,
+    }
+
+
+@to_dict.register
+def _(data: ConnectionDeletionPipelineChangeData) -> dict:
+    return {
+        "uniqueID": data.id,
+        "updateType": data.change_type.name,
+        "conID": data.connection_id,
+        "fromOpID": data.from_operator_id,
+        "toOpID": data.to_operator_id,
+        "fromSockID": data.from_socket_id,
+        "toSockID": data.to_socket_id,
+    }
+
 
 @dataclass
 class JsonDumper:
@@ -93,7 +167,7 @@ class JsonDumper:
 
     @staticmethod
     def debug_step_data_from_json(raw: str) -> DebugStepData:
-        data = json.loads(raw)
+        data = loads(raw)
 
         # Fetch metrics
         metrics_data = data["metrics"]
@@ -125,9 +199,9 @@ class JsonDumper:
     @staticmethod
     def load_init_data(path: Path) -> Iterator[PipelineChangeData]:
         with open(path, "r") as file:
-            for line in file.readlines():
+            for line in file:
                 pipeline_change_data = JsonDumper.pipeline_change_data_from_json(
-                    json.loads(line)
+                    loads(line)
                 )
                 if pipeline_change_data is not None:
                     yield pipeline_change_data
@@ -135,68 +209,14 @@ class JsonDumper:
     @staticmethod
     def load_execution_data(path: Path) -> Iterator[DebugStepData]:
         with open(path, "r") as file:
-            for line in file.readlines():
+            for line in file:
                 yield JsonDumper.debug_step_data_from_json(line)
 
     @staticmethod
     def pipeline_change_data_to_dict(
         data: PipelineChangeData,
     ) -> dict:  # type:ignore
-        if data.change_type == PipelineChangeType.OPERATOR_CREATION and isinstance(
-            data, OperatorCreationPipelineChangeData
-        ):
-            return {
-                "uniqueID": data.id,
-                "updateType": data.change_type.name,
-                "opID": data.operator_id,
-                "opName": data.operator_name,
-                "opData": data.operator_data,
-            }
-        elif (
-            data.change_type == PipelineChangeType.OPERATOR_MODIFICATION
-            and isinstance(data, OperatorModificationPipelineChangeData)
-        ):
-            return {
-                "uniqueID": data.id,
-                "updateType": data.change_type.name,
-                "opID": data.operator_id,
-                "opName": data.operator_name,
-                "changedParam": data.changed_parameter,
-                "changedVal": data.changed_value,
-            }
-        elif data.change_type == PipelineChangeType.OPERATOR_DELETION and isinstance(
-            data, OperatorDeletionPipelineChangeData
-        ):
-            return {
-                "uniqueID": data.id,
-                "updateType": data.change_type.name,
-                "opID": data.operator_id,
-                "opName": data.operator_name,
-            }
-        elif data.change_type == PipelineChangeType.CONNECTION_CREATION and isinstance(
-            data, ConnectionCreationPipelineChangeData
-        ):
-            return {
-                "uniqueID": data.id,
-                "updateType": data.change_type.name,
-                "conID": data.connection_id,
-                "fromOpID": data.from_operator_id,
-                "toOpID": data.to_operator_id,
-                "fromSockID": data.from_socket_id,
-                "toSockID": data.to_socket_id,
-            }
-        elif data.change_type == PipelineChangeType.CONNECTION_DELETION and isinstance(
-            data, ConnectionDeletionPipelineChangeData
-        ):
-            return {
-                "uniqueID": data.id,
-                "updateType": data.change_type.name,
-                "conID": data.connection_id,
-                "fromOpID": data.from_operator_id,
-                "toOpID": data.to_operator_id,
-                "fromSockID": data.from_socket_id,
-                "toSockID": data.to_socket_id,
-            }
+        return to_dict(data)
 
     @staticmethod
     def pipeline_change_data_to_json(data: dict[str, Any]) -> str:
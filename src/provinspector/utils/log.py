@@ -7,7 +7,20 @@ LOG_FORMAT = (
 )
 
 
+class _LogHolder:
+    # Class attributes are evaluated once, so the logger lookup happens a single time
+    logger = logging.getLogger("provinspector")
+
+
+def get_logger() -> logging.Logger:
+    return _LogHolder.logger
+
+
 def create_logger():
+    # Only configure once, repeated calls would rebuild the handler and formatter each time
+    if getattr(create_logger, "_configured", False):
+        return
+
     logging.basicConfig(
         level=LOG_LEVEL,
         format=LOG_FORMAT,
@@ -15,3 +28,4 @@ def create_logger():
         force=True,
     )
     logging.getLogger().setLevel(LOG_LEVEL)
+    create_logger._configured = True  # type:ignore
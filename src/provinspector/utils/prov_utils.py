@@ -1,20 +1,34 @@
+import functools
+import sys
 from typing import Sequence
 
 import prov.model
 
 
+# Default namespace, constructed once at import; `document_factory` binds the
+# shared object to each new document instead of re-parsing the URI per call
+_DEFAULT_NAMESPACE = prov.model.Namespace(
+    "", "https://dbgit.prakinf.tu-ilmenau.de/masc7357/provinspector/"
+)
+
+
 def document_factory(
     records: Sequence[prov.model.ProvRecord] | None = None,
 ) -> prov.model.ProvDocument:
     doc = prov.model.ProvDocument(records=records)
-    doc.set_default_namespace(
-        uri="https://dbgit.prakinf.tu-ilmenau.de/masc7357/provinspector/"
-    )
+
+    # Mirrors `NamespaceManager.set_default_namespace` with the cached namespace
+    doc._namespaces._default = _DEFAULT_NAMESPACE
+    doc._namespaces[""] = _DEFAULT_NAMESPACE
 
     return doc
 
 
+@functools.lru_cache(maxsize=None)
 def qualified_name(localpart: str) -> prov.model.QualifiedName:
-    namespace = document_factory().get_default_namespace()
-
-    return prov.model.QualifiedName(namespace=namespace, localpart=localpart)
+    # The interned localpart lets later identifier comparisons and dict
+    # lookups short-circuit on string identity
+    return prov.model.QualifiedName(
+        namespace=_DEFAULT_NAMESPACE,
+        localpart=sys.intern(localpart),
+    )
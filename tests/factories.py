@@ -0,0 +1,20 @@
+import itertools
+
+from provinspector.data import OperatorCreationPipelineChangeData
+
+_seq = itertools.count()
+
+
+def operator_creation_pipeline_change_data() -> OperatorCreationPipelineChangeData:
+    """
+    Create operator creation pipeline change data with deterministic, sequential ids.
+    """
+
+    seq = next(_seq)
+
+    return OperatorCreationPipelineChangeData(
+        id=f"op-{seq}",
+        operator_id=seq % 11,
+        operator_name="random-name",
+        operator_data={},
+    )
@@ -1,9 +1,28 @@
+import datetime
+import uuid
+
 import pytest
 
-from provinspector.storage.adapter import start_docker_container, stop_docker_container
+from provinspector.provinspector import ProvInspector
+from provinspector.storage.adapter import (
+    Neo4JAdapter,
+    start_docker_container,
+    stop_docker_container,
+)
+from provinspector.storage.database import ProvGraphDatabase
+
+
+@pytest.fixture(scope="session")
+def precomputed_ids():
+    # Deterministic identifiers computed once per session, so tests neither
+    # draw urandom entropy per `uuid4` call nor depend on the wall clock
+    return {
+        "today": datetime.datetime(2024, 1, 1),
+        "uuids": [str(uuid.UUID(int=n)) for n in range(16)],
+    }
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def neo4j_context():
     docker_client, container = start_docker_container(
         docker_socket="unix:///run/user/1000/docker.sock",
@@ -14,6 +33,7 @@ def neo4j_context():
         environment=["NEO4J_AUTH=neo4j/neo4jneo4j"],
         name="neo4j",
         image="neo4j:4.4",
+        tmpfs={"/data": "rw,size=512m"},
     )
 
     if container is None:
@@ -25,3 +45,23 @@ def neo4j_context():
         docker_client=docker_client,
         container=container,
     )
+
+
+@pytest.fixture(scope="module")
+def provinspector(neo4j_context):
+    # The community edition ships a single database, so all Neo4J-backed tests
+    # share it and are pinned to one pytest-xdist worker via the `neo4j` xdist
+    # group (run with `--dist loadgroup`)
+
+    # One inspector per module keeps a single Bolt connection pool across tests
+    inspector = ProvInspector(
+        provenance_database=ProvGraphDatabase(
+            adapter=Neo4JAdapter(
+                use_docker=False,
+            )
+        ),
+    )
+
+    yield inspector
+
+    inspector.shutdown()
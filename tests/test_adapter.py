@@ -1,23 +1,51 @@
-from provinspector.storage.adapter import DBMSType, MemgraphAdapter, Neo4JAdapter
+import pytest
 
+from provinspector.storage.adapter import DBMSType
 
-class TestDBMSTypeEnum:
-    def test(self):
-        assert str(DBMSType.NEO4J) == "Neo4J"
-        assert str(DBMSType.MEMGRAPH) == "MemGraph"
 
+# Function-scoped on purpose: both adapters publish host port 7687, so each
+# container must be stopped before the other test starts its own
+@pytest.fixture
+def neo4j_adapter():
+    # Defer the adapter import so collection does not pay for the docker and database drivers
+    from provinspector.storage.adapter import Neo4JAdapter
 
-class TestNeo4JAdapter:
-    def test_post_init(self):
-        adapter = Neo4JAdapter(
-            docker_socket="unix:///run/user/1000/docker.sock",
-        )
-        adapter.shutdown()
+    adapter = Neo4JAdapter(
+        docker_socket="unix:///run/user/1000/docker.sock",
+    )
+    yield adapter
+    adapter.shutdown()
 
 
-class TestMemgraphAdapter:
-    def test_post_init(self):
-        adapter = MemgraphAdapter(
-            docker_socket="unix:///run/user/1000/docker.sock",
-        )
-        adapter.shutdown()
+@pytest.fixture
+def memgraph_adapter():
+    from provinspector.storage.adapter import MemgraphAdapter
+
+    adapter = MemgraphAdapter(
+        docker_socket="unix:///run/user/1000/docker.sock",
+    )
+    yield adapter
+    adapter.shutdown()
+
+
+@pytest.mark.parametrize(
+    "member,expected",
+    [
+        (DBMSType.NEO4J, "Neo4J"),
+        (DBMSType.MEMGRAPH, "MemGraph"),
+    ],
+)
+def test_dbms_type_str(member, expected):
+    assert str(member) == expected
+
+
+# Both adapters bind host port 7687, so they are pinned to the worker running
+# all tests that touch the shared Neo4J instance
+@pytest.mark.xdist_group("neo4j")
+def test_neo4j_adapter_post_init(neo4j_adapter):
+    assert neo4j_adapter is not None
+
+
+@pytest.mark.xdist_group("neo4j")
+def test_memgraph_adapter_post_init(memgraph_adapter):
+    assert memgraph_adapter is not None
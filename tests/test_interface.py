@@ -1,14 +1,10 @@
-import random
-from uuid import uuid4
-
 from provinspector.data import OperatorCreationPipelineChangeData
 
+from tests.factories import operator_creation_pipeline_change_data
+
 
 class TestOperatorCreationPipelineChangeData:
     def test_init(self):
-        data = OperatorCreationPipelineChangeData(
-            id=str(uuid4()),
-            operator_id=random.randint(0, 10),
-            operator_name="random-name",
-            operator_data={},
-        )
+        data = operator_creation_pipeline_change_data()
+
+        assert type(data) is OperatorCreationPipelineChangeData
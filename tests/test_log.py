@@ -1,13 +1,18 @@
 import logging
 
-from provinspector.utils.log import LOG_FORMAT, LOG_LEVEL, create_logger
+from provinspector.utils.log import LOG_FORMAT, LOG_LEVEL, create_logger, get_logger
 
 
 class TestLog:
     def test_create_logger(self):
+        create_logger()
         create_logger()
         log = logging.getLogger()
 
         assert log.level == LOG_LEVEL
 
+        assert len(log.handlers) == 1
         assert log.handlers[0].formatter._fmt == LOG_FORMAT  # type:ignore
+
+    def test_get_logger(self):
+        assert get_logger() is get_logger()
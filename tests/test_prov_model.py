@@ -1,10 +1,14 @@
 import datetime
+import functools
+import itertools
 import random
-import unittest
+import sys
 import uuid
+from collections import Counter, namedtuple
 from typing import Type
 
 import prov.model
+import pytest
 
 from provinspector.domain.constants import (
     OperatorStepType,
@@ -39,6 +43,7 @@ from provinspector.prov.model import (
     OperatorModificationModel,
     PipelineVersionCreationModel,
     ProvContext,
+    project,
 )
 
 today = datetime.datetime.now()
@@ -46,6 +51,42 @@ yesterday = today - datetime.timedelta(days=1)
 tomorrow = today + datetime.timedelta(days=1)
 
 
+# Interned so repeated attribute keys share one string object and compare by identity
+_PROV_ATTR_TIME_STR = sys.intern(str(prov.model.PROV_ATTR_TIME))
+_PROV_ROLE_STR = sys.intern(str(prov.model.PROV_ROLE))
+
+
+# Constant role-only attribute lists, promoted to shared tuples so the
+# builds do not allocate a fresh list per relation
+_ATTRS_USED_OPERATOR_REVISION = ((_PROV_ROLE_STR, ProvRole.USED_OPERATOR_REVISION),)
+_ATTRS_USED_PARENT_OPERATOR_REVISION = (
+    (_PROV_ROLE_STR, ProvRole.USED_PARENT_OPERATOR_REVISION),
+)
+_ATTRS_USED_PARENT_PIPELINE_VERSION = (
+    (_PROV_ROLE_STR, ProvRole.USED_PARENT_PIPELINE_VERSION),
+)
+_ATTRS_USED_PARENT_PIPELINE_VERSION_REVISION = (
+    (_PROV_ROLE_STR, ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION),
+)
+
+
+# Shared immutable sentinel for revisions without operators or connections;
+# the builds only iterate these fields
+_EMPTY: tuple = ()
+
+
+_uuid_counter = itertools.count()
+
+
+def _tuuid() -> str:
+    """Return a deterministic uuid-formatted string, avoiding the urandom syscall of `uuid4`."""
+    return str(uuid.UUID(int=next(_uuid_counter)))
+
+
+def _time_role_attrs(time, role) -> list:
+    return [(_PROV_ATTR_TIME_STR, time), (_PROV_ROLE_STR, role)]
+
+
 def create_pipeline_change(
     parent: PipelineChange | None,
     time: datetime.datetime,
@@ -56,16 +97,16 @@ def create_pipeline_change(
     )
 
     pipeline_version_revision = PipelineVersionRevision(
-        uuid=str(uuid.uuid4()),
+        uuid=_tuuid(),
         id_=0,
         pipeline_version=pipeline_version,
         parent_pipeline_version_revision_uuid=None,
-        operators=list(),
-        connections=list(),
+        operators=_EMPTY,
+        connections=_EMPTY,
     )
 
     return PipelineChange(
-        uuid=str(uuid.uuid4()),
+        uuid=_tuuid(),
         pipeline_change_type=PipelineChangeType.OPERATOR_CREATION,
         time=time,
         operator_revision=None,
@@ -78,17 +119,214 @@ def create_pipeline_change(
 def relation_qualified_name(
     source,
     target,
+) -> prov.model.QualifiedName:
+    return _relation_qualified_name(str(source.identifier), str(target.identifier))
+
+
+def _entity(doc: prov.model.ProvDocument, dataclass_instance) -> prov.model.ProvEntity:
+    """Create the document entity for `dataclass_instance` from its memoized record."""
+    record = dataclass_instance.to_prov()
+    return doc.entity(record.identifier, other_attributes=record.attributes)
+
+
+def _member_entity(
+    doc: prov.model.ProvDocument,
+    collection: prov.model.ProvEntity,
+    dataclass_instance,
+) -> prov.model.ProvEntity:
+    """Create the entity for `dataclass_instance` and add it to `collection` in one step."""
+    record = dataclass_instance.to_prov()
+    entity = doc.entity(
+        identifier=record.identifier,
+        other_attributes=record.attributes,
+    )
+    doc.hadMember(collection=collection, entity=entity)
+    return entity
+
+
+_Scaffold = namedtuple(
+    "_Scaffold",
+    [
+        "connection",
+        "operator",
+        "operator_revision",
+        "pipeline_version",
+        "parent_pipeline_version_revision",
+        "pipeline_version_revision",
+        "parent_pipeline_change",
+    ],
+)
+
+
+def _make_scaffold(
+    parent_change_type: PipelineChangeType,
+    with_parameter: bool = False,
+) -> _Scaffold:
+    """Construct the domain object graph shared by the `test_build` methods."""
+    connection = Connection(
+        id_=0,
+        from_operator_id=0,
+        to_operator_id=1,
+    )
+    operator = Operator(
+        id_=0,
+        name=_tuuid(),
+    )
+    parameters = (
+        [Parameter(name=_tuuid(), value=random.uniform(0, 1))]
+        if with_parameter
+        else list()
+    )
+    operator_revision = OperatorRevision(
+        uuid=_tuuid(),
+        id_=0,
+        operator=operator,
+        parameters=parameters,
+        parent_operator_revision_uuid=None,
+    )
+    pipeline_version = PipelineVersion(
+        id_=0,
+        parent_pipeline_version_id=None,
+    )
+    parent_pipeline_version_revision = PipelineVersionRevision(
+        uuid=_tuuid(),
+        id_=0,
+        pipeline_version=pipeline_version,
+        parent_pipeline_version_revision_uuid=None,
+        operators=_EMPTY,
+        connections=_EMPTY,
+    )
+    pipeline_version_revision = PipelineVersionRevision(
+        uuid=_tuuid(),
+        id_=1,
+        pipeline_version=pipeline_version,
+        parent_pipeline_version_revision_uuid=parent_pipeline_version_revision.uuid,
+        operators=[operator_revision],
+        connections=[connection],
+    )
+    parent_pipeline_change = PipelineChange(
+        uuid=_tuuid(),
+        pipeline_change_type=parent_change_type,
+        time=today,
+        operator_revision=None,
+        connection=None,
+        pipeline_version_revision=parent_pipeline_version_revision,
+        parent_pipeline_change_uuid=None,
+    )
+
+    return _Scaffold(
+        connection=connection,
+        operator=operator,
+        operator_revision=operator_revision,
+        pipeline_version=pipeline_version,
+        parent_pipeline_version_revision=parent_pipeline_version_revision,
+        pipeline_version_revision=pipeline_version_revision,
+        parent_pipeline_change=parent_pipeline_change,
+    )
+
+
+def _build_header(
+    doc: prov.model.ProvDocument,
+    pipeline_change: PipelineChange,
+    parent_pipeline_change: PipelineChange | None,
+) -> prov.model.ProvActivity:
+    """Add the `PipelineChange` activity, its parent, and their relation."""
+    pipeline_change_proj = project(pipeline_change)
+    pipeline_change_activity = doc.activity(
+        pipeline_change_proj.identifier,
+        pipeline_change_proj.start_time,
+        pipeline_change_proj.end_time,
+        pipeline_change_proj.attributes,
+    )
+    if parent_pipeline_change:
+        parent_pipeline_change_proj = project(parent_pipeline_change)
+        parent_pipeline_change_activity = doc.activity(
+            parent_pipeline_change_proj.identifier,
+            parent_pipeline_change_proj.start_time,
+            parent_pipeline_change_proj.end_time,
+            parent_pipeline_change_proj.attributes,
+        )
+        doc.wasInformedBy(
+            informed=pipeline_change_activity,
+            informant=parent_pipeline_change_activity,
+            identifier=relation_qualified_name(
+                pipeline_change_activity,
+                parent_pipeline_change_activity,
+            ),
+        )
+
+    return pipeline_change_activity
+
+
+def _build_common_tail(
+    doc: prov.model.ProvDocument,
+    pipeline_change_activity: prov.model.ProvActivity,
+    start_time,
+    pipeline_version_revision: PipelineVersionRevision,
+    parent_pipeline_version_revision: PipelineVersionRevision | None,
+) -> None:
+    """Add the `PipelineVersionRevision` with its members, the `PipelineVersion`, and the parent revision relations shared by all pipeline change builds."""
+    pipeline_version_revision_entity = _entity(doc, pipeline_version_revision)
+    for member in itertools.chain(
+        pipeline_version_revision.operators,
+        pipeline_version_revision.connections,
+    ):
+        _member_entity(doc, pipeline_version_revision_entity, member)
+    doc.wasGeneratedBy(
+        entity=pipeline_version_revision_entity,
+        activity=pipeline_change_activity,
+        time=start_time,
+        identifier=relation_qualified_name(
+            pipeline_version_revision_entity, pipeline_change_activity
+        ),
+        other_attributes=_time_role_attrs(
+            start_time, ProvRole.CREATED_PIPELINE_VERSION_REVISION
+        ),
+    )
+
+    pipeline_version = pipeline_version_revision.pipeline_version
+    pipeline_version_entity = _entity(doc, pipeline_version)
+    doc.specializationOf(
+        specificEntity=pipeline_version_revision_entity,
+        generalEntity=pipeline_version_entity,
+    )
+    if parent_pipeline_version_revision:
+        parent_pipeline_version_revision_entity = _entity(
+            doc, parent_pipeline_version_revision
+        )
+        doc.wasRevisionOf(
+            generatedEntity=pipeline_version_revision_entity,
+            usedEntity=parent_pipeline_version_revision_entity,
+            identifier=relation_qualified_name(
+                pipeline_version_revision_entity,
+                parent_pipeline_version_revision_entity,
+            ),
+        )
+        doc.used(
+            activity=pipeline_change_activity,
+            entity=parent_pipeline_version_revision_entity,
+            time=start_time,
+            identifier=relation_qualified_name(
+                pipeline_change_activity,
+                parent_pipeline_version_revision_entity,
+            ),
+            other_attributes=_ATTRS_USED_PARENT_PIPELINE_VERSION_REVISION,
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _relation_qualified_name(
+    source_identifier: str,
+    target_identifier: str,
 ) -> prov.model.QualifiedName:
     return prov.model.QualifiedName(
         DEFAULT_NAMESPACE,
-        f"relation:{source.identifier}:{target.identifier}",
+        f"relation:{source_identifier}:{target_identifier}",
     )
 
 
 class TestProvContext:
     def test_add_element(self):
-        case = unittest.TestCase()
-
         pipeline_change = create_pipeline_change(
             parent=None,
             time=today,
@@ -101,7 +339,10 @@ class TestProvContext:
 
         assert el._prov_type == el_expected._prov_type
         assert el.identifier == el_expected.identifier
-        case.assertCountEqual(el.attributes, el_expected.attributes)
+        # Order-insensitive attribute comparison; repr keeps unhashable values countable
+        assert Counter(map(repr, el.attributes)) == Counter(
+            map(repr, el_expected.attributes)
+        )
 
     def test_add_relation(self):
         parent_pipeline_change = create_pipeline_change(
@@ -153,18 +394,23 @@ class TestPipelineVersionCreationModel:
         doc = prov.model.ProvDocument()
 
         # Add `PipelineVersionCreation`, parent `PipelineVersionCreation`, and relation
+        pipeline_version_creation_proj = project(pipeline_version_creation)
         pipeline_version_creation_activity = doc.activity(
-            pipeline_version_creation.to_prov().identifier,
-            pipeline_version_creation.to_prov().get_startTime(),
-            pipeline_version_creation.to_prov().get_endTime(),
-            pipeline_version_creation.to_prov().attributes,
+            pipeline_version_creation_proj.identifier,
+            pipeline_version_creation_proj.start_time,
+            pipeline_version_creation_proj.end_time,
+            pipeline_version_creation_proj.attributes,
         )
+        start_time = pipeline_version_creation_activity.get_startTime()
         if parent_pipeline_version_creation:
+            parent_pipeline_version_creation_proj = project(
+                parent_pipeline_version_creation
+            )
             parent_pipeline_version_creation_activity = doc.activity(
-                parent_pipeline_version_creation.to_prov().identifier,
-                parent_pipeline_version_creation.to_prov().get_startTime(),
-                parent_pipeline_version_creation.to_prov().get_endTime(),
-                parent_pipeline_version_creation.to_prov().attributes,
+                parent_pipeline_version_creation_proj.identifier,
+                parent_pipeline_version_creation_proj.start_time,
+                parent_pipeline_version_creation_proj.end_time,
+                parent_pipeline_version_creation_proj.attributes,
             )
             doc.wasInformedBy(
                 informed=pipeline_version_creation_activity,
@@ -177,49 +423,28 @@ class TestPipelineVersionCreationModel:
 
         # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
         pipeline_version_revision = pipeline_version_creation.pipeline_version_revision
-        pipeline_version_revision_entity = doc.entity(
-            identifier=pipeline_version_revision.to_prov().identifier,
-            other_attributes=pipeline_version_revision.to_prov().attributes,
-        )
-        for operator_revision in pipeline_version_revision.operators:
-            operator_revision_entity = doc.entity(
-                identifier=operator_revision.to_prov().identifier,
-                other_attributes=operator_revision.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=operator_revision_entity,
-            )
-        for connection in pipeline_version_revision.connections:
-            connection_entity = doc.entity(
-                identifier=connection.to_prov().identifier,
-                other_attributes=connection.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=connection_entity,
-            )
+        pipeline_version_revision_entity = _entity(doc, pipeline_version_revision)
+        for member in itertools.chain(
+            pipeline_version_revision.operators,
+            pipeline_version_revision.connections,
+        ):
+            _member_entity(doc, pipeline_version_revision_entity, member)
         doc.wasGeneratedBy(
             entity=pipeline_version_revision_entity,
             activity=pipeline_version_creation_activity,
-            time=pipeline_version_creation_activity.get_startTime(),
+            time=start_time,
             identifier=relation_qualified_name(
                 pipeline_version_revision_entity, pipeline_version_creation_activity
             ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_version_creation_activity.get_startTime(),
-                ),
-                (prov.model.PROV_ROLE, ProvRole.CREATED_PIPELINE_VERSION_REVISION),
-            ],
+            other_attributes=_time_role_attrs(
+                start_time, ProvRole.CREATED_PIPELINE_VERSION_REVISION
+            ),
         )
 
         # Add parent `PipelineVersionRevision`, and relations
         if parent_pipeline_version_revision:
-            parent_pipeline_version_revision_entity = doc.entity(
-                identifier=parent_pipeline_version_revision.to_prov().identifier,
-                other_attributes=parent_pipeline_version_revision.to_prov().attributes,
+            parent_pipeline_version_revision_entity = _entity(
+                doc, parent_pipeline_version_revision
             )
             doc.wasDerivedFrom(
                 generatedEntity=pipeline_version_revision_entity,
@@ -232,25 +457,17 @@ class TestPipelineVersionCreationModel:
             doc.used(
                 activity=pipeline_version_creation_activity,
                 entity=parent_pipeline_version_revision_entity,
-                time=pipeline_version_creation_activity.get_startTime(),
+                time=start_time,
                 identifier=relation_qualified_name(
                     pipeline_version_creation_activity,
                     parent_pipeline_version_revision_entity,
                 ),
-                other_attributes=[
-                    (
-                        str(prov.model.PROV_ROLE),
-                        ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
-                    )
-                ],
+                other_attributes=_ATTRS_USED_PARENT_PIPELINE_VERSION_REVISION,
             )
 
         # Add created `PipelineVersion`, parent `PipelineVersion`, and relations
         pipeline_version = pipeline_version_revision.pipeline_version
-        pipeline_version_entity = doc.entity(
-            identifier=pipeline_version.to_prov().identifier,
-            other_attributes=pipeline_version.to_prov().attributes,
-        )
+        pipeline_version_entity = _entity(doc, pipeline_version)
         doc.specializationOf(
             specificEntity=pipeline_version_revision_entity,
             generalEntity=pipeline_version_entity,
@@ -258,29 +475,24 @@ class TestPipelineVersionCreationModel:
         doc.wasGeneratedBy(
             entity=pipeline_version_entity,
             activity=pipeline_version_creation_activity,
-            time=pipeline_version_creation_activity.get_startTime(),
+            time=start_time,
             identifier=relation_qualified_name(
                 pipeline_version_entity, pipeline_version_creation_activity
             ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_version_creation_activity.get_startTime(),
-                ),
-                (prov.model.PROV_ROLE, ProvRole.CREATED_PIPELINE_VERSION),
-            ],
+            other_attributes=_time_role_attrs(
+                start_time, ProvRole.CREATED_PIPELINE_VERSION
+            ),
         )
         if parent_pipeline_version_creation:
             parent_pipeline_version = (
                 parent_pipeline_version_creation.pipeline_version_revision.pipeline_version
             )
-            if pipeline_version == parent_pipeline_version:
+            # Identity suffices: `to_prov` is memoized per instance, so a shared
+            # `PipelineVersion` reference always yields the same entity
+            if pipeline_version is parent_pipeline_version:
                 parent_pipeline_version_entity = pipeline_version_entity
             else:
-                parent_pipeline_version_entity = doc.entity(
-                    identifier=parent_pipeline_version.to_prov().identifier,
-                    other_attributes=parent_pipeline_version.to_prov().attributes,
-                )
+                parent_pipeline_version_entity = _entity(doc, parent_pipeline_version)
             if parent_pipeline_version_revision:
                 # parent_pipeline_version_revision_entity = doc.entity(
                 #     identifier=parent_pipeline_version_revision.to_prov().identifier,
@@ -301,22 +513,21 @@ class TestPipelineVersionCreationModel:
             doc.used(
                 activity=pipeline_version_creation_activity,
                 entity=parent_pipeline_version_entity,
-                time=pipeline_version_creation_activity.get_startTime(),
+                time=start_time,
                 identifier=relation_qualified_name(
                     pipeline_version_creation_activity,
                     parent_pipeline_version_entity,
                 ),
-                other_attributes=[
-                    (
-                        str(prov.model.PROV_ROLE),
-                        ProvRole.USED_PARENT_PIPELINE_VERSION,
-                    )
-                ],
+                other_attributes=_ATTRS_USED_PARENT_PIPELINE_VERSION,
             )
 
         return doc
 
-    def test_build(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def scaffold() -> (
+        tuple[PipelineVersionCreation, PipelineVersionRevision, PipelineVersionCreation]
+    ):
         connection = Connection(
             id_=0,
             from_operator_id=0,
@@ -324,14 +535,14 @@ class TestPipelineVersionCreationModel:
         )
         operator = Operator(
             id_=0,
-            name=str(uuid.uuid4()),
+            name=_tuuid(),
         )
         parameter = Parameter(
-            name=str(uuid.uuid4()),
+            name=_tuuid(),
             value=random.uniform(0, 1),
         )
         operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=0,
             operator=operator,
             parameters=[parameter],
@@ -342,21 +553,21 @@ class TestPipelineVersionCreationModel:
             parent_pipeline_version_id=None,
         )
         parent_pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=0,
             pipeline_version=pipeline_version,
             parent_pipeline_version_revision_uuid=None,
-            operators=list(),
-            connections=list(),
+            operators=_EMPTY,
+            connections=_EMPTY,
         )
         parent_pipeline_version_creation = PipelineVersionCreation(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             pipeline_version_revision=parent_pipeline_version_revision,
             parent_pipeline_version_creation_uuid=None,
             time=today,
         )
         pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=1,
             pipeline_version=pipeline_version,
             parent_pipeline_version_revision_uuid=parent_pipeline_version_revision.uuid,
@@ -364,11 +575,25 @@ class TestPipelineVersionCreationModel:
             connections=[connection],
         )
         pipeline_version_creation = PipelineVersionCreation(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             pipeline_version_revision=pipeline_version_revision,
             parent_pipeline_version_creation_uuid=parent_pipeline_version_creation.uuid,
             time=today,
         )
+
+        return (
+            pipeline_version_creation,
+            parent_pipeline_version_revision,
+            parent_pipeline_version_creation,
+        )
+
+    def test_build(self, scaffold):
+        (
+            pipeline_version_creation,
+            parent_pipeline_version_revision,
+            parent_pipeline_version_creation,
+        ) = scaffold
+
         model = PipelineVersionCreationModel(
             pipeline_version_creation=pipeline_version_creation,
             parent_pipeline_version_revision=parent_pipeline_version_revision,
@@ -395,18 +620,21 @@ class TestOperatorCreationModel:
         doc = prov.model.ProvDocument()
 
         # Add `PipelineChange`, parent `PipelineChange`, and relation
+        pipeline_change_proj = project(pipeline_change)
         pipeline_change_activity = doc.activity(
-            pipeline_change.to_prov().identifier,
-            pipeline_change.to_prov().get_startTime(),
-            pipeline_change.to_prov().get_endTime(),
-            pipeline_change.to_prov().attributes,
+            pipeline_change_proj.identifier,
+            pipeline_change_proj.start_time,
+            pipeline_change_proj.end_time,
+            pipeline_change_proj.attributes,
         )
+        start_time = pipeline_change_activity.get_startTime()
         if parent_pipeline_change:
+            parent_pipeline_change_proj = project(parent_pipeline_change)
             parent_pipeline_change_activity = doc.activity(
-                parent_pipeline_change.to_prov().identifier,
-                parent_pipeline_change.to_prov().get_startTime(),
-                parent_pipeline_change.to_prov().get_endTime(),
-                parent_pipeline_change.to_prov().attributes,
+                parent_pipeline_change_proj.identifier,
+                parent_pipeline_change_proj.start_time,
+                parent_pipeline_change_proj.end_time,
+                parent_pipeline_change_proj.attributes,
             )
             doc.wasInformedBy(
                 informed=pipeline_change_activity,
@@ -419,31 +647,19 @@ class TestOperatorCreationModel:
 
         # Add created `Operator`, corresponding `OperatorRevision`, and relations
         operator_revision = pipeline_change.operator_revision
-        operator_revision_entity = doc.entity(
-            identifier=operator_revision.to_prov().identifier,
-            other_attributes=operator_revision.to_prov().attributes,
-        )
+        operator_revision_entity = _entity(doc, operator_revision)
         doc.wasGeneratedBy(
             entity=operator_revision_entity,
             activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
+            time=start_time,
             identifier=relation_qualified_name(
                 operator_revision_entity,
                 pipeline_change_activity,
             ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (prov.model.PROV_ROLE, ProvRole.CREATED_OPERATOR),
-            ],
+            other_attributes=_time_role_attrs(start_time, ProvRole.CREATED_OPERATOR),
         )
         operator = operator_revision.operator
-        operator_entity = doc.entity(
-            identifier=operator.to_prov().identifier,
-            other_attributes=operator.to_prov().attributes,
-        )
+        operator_entity = _entity(doc, operator)
         doc.specializationOf(
             specificEntity=operator_revision_entity,
             generalEntity=operator_entity,
@@ -451,69 +667,38 @@ class TestOperatorCreationModel:
 
         # Add operator parameters and relations
         for parameter in operator_revision.parameters:
-            parameter_entity = doc.entity(
-                identifier=parameter.to_prov().identifier,
-                other_attributes=parameter.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=operator_revision_entity,
-                entity=parameter_entity,
-            )
+            _member_entity(doc, operator_revision_entity, parameter)
 
         # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
         pipeline_version_revision = pipeline_change.pipeline_version_revision
-        pipeline_version_revision_entity = doc.entity(
-            identifier=pipeline_version_revision.to_prov().identifier,
-            other_attributes=pipeline_version_revision.to_prov().attributes,
-        )
-        for operator_revision in pipeline_version_revision.operators:
-            operator_revision_entity = doc.entity(
-                identifier=operator_revision.to_prov().identifier,
-                other_attributes=operator_revision.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=operator_revision_entity,
-            )
-        for connection in pipeline_version_revision.connections:
-            connection_entity = doc.entity(
-                identifier=connection.to_prov().identifier,
-                other_attributes=connection.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=connection_entity,
-            )
+        pipeline_version_revision_entity = _entity(doc, pipeline_version_revision)
+        for member in itertools.chain(
+            pipeline_version_revision.operators,
+            pipeline_version_revision.connections,
+        ):
+            _member_entity(doc, pipeline_version_revision_entity, member)
         doc.wasGeneratedBy(
             entity=pipeline_version_revision_entity,
             activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
+            time=start_time,
             identifier=relation_qualified_name(
                 pipeline_version_revision_entity, pipeline_change_activity
             ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (prov.model.PROV_ROLE, ProvRole.CREATED_PIPELINE_VERSION_REVISION),
-            ],
+            other_attributes=_time_role_attrs(
+                start_time, ProvRole.CREATED_PIPELINE_VERSION_REVISION
+            ),
         )
 
         # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
         pipeline_version = pipeline_version_revision.pipeline_version
-        pipeline_version_entity = doc.entity(
-            identifier=pipeline_version.to_prov().identifier,
-            other_attributes=pipeline_version.to_prov().attributes,
-        )
+        pipeline_version_entity = _entity(doc, pipeline_version)
         doc.specializationOf(
             specificEntity=pipeline_version_revision_entity,
             generalEntity=pipeline_version_entity,
         )
         if parent_pipeline_version_revision:
-            parent_pipeline_version_revision_entity = doc.entity(
-                identifier=parent_pipeline_version_revision.to_prov().identifier,
-                other_attributes=parent_pipeline_version_revision.to_prov().attributes,
+            parent_pipeline_version_revision_entity = _entity(
+                doc, parent_pipeline_version_revision
             )
             doc.wasRevisionOf(
                 generatedEntity=pipeline_version_revision_entity,
@@ -526,17 +711,12 @@ class TestOperatorCreationModel:
             doc.used(
                 activity=pipeline_change_activity,
                 entity=parent_pipeline_version_revision_entity,
-                time=pipeline_change_activity.get_startTime(),
+                time=start_time,
                 identifier=relation_qualified_name(
                     pipeline_change_activity,
                     parent_pipeline_version_revision_entity,
                 ),
-                other_attributes=[
-                    (
-                        str(prov.model.PROV_ROLE),
-                        ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
-                    )
-                ],
+                other_attributes=_ATTRS_USED_PARENT_PIPELINE_VERSION_REVISION,
             )
 
         return doc
@@ -549,14 +729,14 @@ class TestOperatorCreationModel:
         )
         operator = Operator(
             id_=0,
-            name=str(uuid.uuid4()),
+            name=_tuuid(),
         )
         parameter = Parameter(
-            name=str(uuid.uuid4()),
+            name=_tuuid(),
             value=random.uniform(0, 1),
         )
         operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=0,
             operator=operator,
             parameters=[parameter],
@@ -567,15 +747,15 @@ class TestOperatorCreationModel:
             parent_pipeline_version_id=None,
         )
         parent_pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=0,
             pipeline_version=pipeline_version,
             parent_pipeline_version_revision_uuid=None,
-            operators=list(),
-            connections=list(),
+            operators=_EMPTY,
+            connections=_EMPTY,
         )
         pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=1,
             pipeline_version=pipeline_version,
             parent_pipeline_version_revision_uuid=parent_pipeline_version_revision.uuid,
@@ -583,7 +763,7 @@ class TestOperatorCreationModel:
             connections=[connection],
         )
         parent_pipeline_change = PipelineChange(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             pipeline_change_type=PipelineChangeType.CONNECTION_CREATION,
             time=today,
             operator_revision=None,
@@ -592,7 +772,7 @@ class TestOperatorCreationModel:
             parent_pipeline_change_uuid=None,
         )
         pipeline_change = OperatorCreationPipelineChange(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             time=today,
             operator_revision=operator_revision,
             pipeline_version_revision=pipeline_version_revision,
@@ -624,173 +804,66 @@ class TestOperatorModificationModel:
     ) -> prov.model.ProvDocument:
         doc = prov.model.ProvDocument()
 
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        pipeline_change_activity = doc.activity(
-            pipeline_change.to_prov().identifier,
-            pipeline_change.to_prov().get_startTime(),
-            pipeline_change.to_prov().get_endTime(),
-            pipeline_change.to_prov().attributes,
-        )
-        if parent_pipeline_change:
-            parent_pipeline_change_activity = doc.activity(
-                parent_pipeline_change.to_prov().identifier,
-                parent_pipeline_change.to_prov().get_startTime(),
-                parent_pipeline_change.to_prov().get_endTime(),
-                parent_pipeline_change.to_prov().attributes,
-            )
-            doc.wasInformedBy(
-                informed=pipeline_change_activity,
-                informant=parent_pipeline_change_activity,
-                identifier=relation_qualified_name(
-                    pipeline_change_activity,
-                    parent_pipeline_change_activity,
-                ),
+        # Stage records and attach them to the document in one extend
+        with ProvContext(doc).batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            pipeline_change_activity = _build_header(
+                doc, pipeline_change, parent_pipeline_change
             )
+            start_time = pipeline_change_activity.get_startTime()
 
-        # Add modified `Operator`, new `OperatorRevision`, parent `OperatorRevision` and relations
-        operator_revision = pipeline_change.operator_revision
-        operator_revision_entity = doc.entity(
-            identifier=operator_revision.to_prov().identifier,
-            other_attributes=operator_revision.to_prov().attributes,
-        )
-        doc.wasGeneratedBy(
-            entity=operator_revision_entity,
-            activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
-            identifier=relation_qualified_name(
-                operator_revision_entity,
-                pipeline_change_activity,
-            ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.MODIFIED_OPERATOR),
-            ],
-        )
-        if parent_operator_revision:
-            parent_operator_revision_entity = doc.entity(
-                identifier=parent_operator_revision.to_prov().identifier,
-                other_attributes=parent_operator_revision.to_prov().attributes,
-            )
-            doc.wasRevisionOf(
-                generatedEntity=operator_revision_entity,
-                usedEntity=parent_operator_revision_entity,
+            # Add modified `Operator`, new `OperatorRevision`, parent `OperatorRevision` and relations
+            operator_revision = pipeline_change.operator_revision
+            operator_revision_entity = _entity(doc, operator_revision)
+            doc.wasGeneratedBy(
+                entity=operator_revision_entity,
+                activity=pipeline_change_activity,
+                time=start_time,
                 identifier=relation_qualified_name(
                     operator_revision_entity,
-                    parent_operator_revision_entity,
+                    pipeline_change_activity,
                 ),
-            )
-            doc.used(
-                activity=pipeline_change_activity,
-                entity=parent_operator_revision_entity,
-                time=pipeline_change_activity.get_startTime(),
-                identifier=relation_qualified_name(
-                    pipeline_change_activity, parent_operator_revision_entity
+                other_attributes=_time_role_attrs(
+                    start_time, ProvRole.MODIFIED_OPERATOR
                 ),
-                other_attributes=[
-                    (str(prov.model.PROV_ROLE), ProvRole.USED_PARENT_OPERATOR_REVISION)
-                ],
-            )
-        operator = operator_revision.operator
-        operator_entity = doc.entity(
-            identifier=operator.to_prov().identifier,
-            other_attributes=operator.to_prov().attributes,
-        )
-        doc.specializationOf(
-            specificEntity=operator_revision_entity,
-            generalEntity=operator_entity,
-        )
-
-        # Add operator parameters and relations
-        for parameter in operator_revision.parameters:
-            parameter_entity = doc.entity(
-                identifier=parameter.to_prov().identifier,
-                other_attributes=parameter.to_prov().attributes,
             )
-            doc.hadMember(
-                collection=operator_revision_entity,
-                entity=parameter_entity,
+            if parent_operator_revision:
+                parent_operator_revision_entity = _entity(doc, parent_operator_revision)
+                doc.wasRevisionOf(
+                    generatedEntity=operator_revision_entity,
+                    usedEntity=parent_operator_revision_entity,
+                    identifier=relation_qualified_name(
+                        operator_revision_entity,
+                        parent_operator_revision_entity,
+                    ),
+                )
+                doc.used(
+                    activity=pipeline_change_activity,
+                    entity=parent_operator_revision_entity,
+                    time=start_time,
+                    identifier=relation_qualified_name(
+                        pipeline_change_activity, parent_operator_revision_entity
+                    ),
+                    other_attributes=_ATTRS_USED_PARENT_OPERATOR_REVISION,
+                )
+            operator = operator_revision.operator
+            operator_entity = _entity(doc, operator)
+            doc.specializationOf(
+                specificEntity=operator_revision_entity,
+                generalEntity=operator_entity,
             )
 
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = pipeline_change.pipeline_version_revision
-        pipeline_version_revision_entity = doc.entity(
-            identifier=pipeline_version_revision.to_prov().identifier,
-            other_attributes=pipeline_version_revision.to_prov().attributes,
-        )
-        for operator_revision in pipeline_version_revision.operators:
-            operator_revision_entity = doc.entity(
-                identifier=operator_revision.to_prov().identifier,
-                other_attributes=operator_revision.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=operator_revision_entity,
-            )
-        for connection in pipeline_version_revision.connections:
-            connection_entity = doc.entity(
-                identifier=connection.to_prov().identifier,
-                other_attributes=connection.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=connection_entity,
-            )
-        doc.wasGeneratedBy(
-            entity=pipeline_version_revision_entity,
-            activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
-            identifier=relation_qualified_name(
-                pipeline_version_revision_entity, pipeline_change_activity
-            ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.CREATED_PIPELINE_VERSION_REVISION),
-            ],
-        )
+            # Add operator parameters and relations
+            for parameter in operator_revision.parameters:
+                _member_entity(doc, operator_revision_entity, parameter)
 
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        pipeline_version = pipeline_version_revision.pipeline_version
-        pipeline_version_entity = doc.entity(
-            identifier=pipeline_version.to_prov().identifier,
-            other_attributes=pipeline_version.to_prov().attributes,
-        )
-        doc.specializationOf(
-            specificEntity=pipeline_version_revision_entity,
-            generalEntity=pipeline_version_entity,
-        )
-        if parent_pipeline_version_revision:
-            parent_pipeline_version_revision_entity = doc.entity(
-                identifier=parent_pipeline_version_revision.to_prov().identifier,
-                other_attributes=parent_pipeline_version_revision.to_prov().attributes,
-            )
-            doc.wasRevisionOf(
-                generatedEntity=pipeline_version_revision_entity,
-                usedEntity=parent_pipeline_version_revision_entity,
-                identifier=relation_qualified_name(
-                    pipeline_version_revision_entity,
-                    parent_pipeline_version_revision_entity,
-                ),
-            )
-            doc.used(
-                activity=pipeline_change_activity,
-                entity=parent_pipeline_version_revision_entity,
-                time=pipeline_change_activity.get_startTime(),
-                identifier=relation_qualified_name(
-                    pipeline_change_activity,
-                    parent_pipeline_version_revision_entity,
-                ),
-                other_attributes=[
-                    (
-                        str(prov.model.PROV_ROLE),
-                        ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
-                    )
-                ],
+            # Add `PipelineVersionRevision` with members, `PipelineVersion`, and relations
+            _build_common_tail(
+                doc,
+                pipeline_change_activity,
+                start_time,
+                pipeline_change.pipeline_version_revision,
+                parent_pipeline_version_revision,
             )
 
         return doc
@@ -803,21 +876,21 @@ class TestOperatorModificationModel:
         )
         operator = Operator(
             id_=0,
-            name=str(uuid.uuid4()),
+            name=_tuuid(),
         )
         parameter = Parameter(
-            name=str(uuid.uuid4()),
+            name=_tuuid(),
             value=random.uniform(0, 1),
         )
         parent_operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=0,
             operator=operator,
             parameters=[parameter],
             parent_operator_revision_uuid=None,
         )
         operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=1,
             operator=operator,
             parameters=[parameter],
@@ -828,15 +901,15 @@ class TestOperatorModificationModel:
             parent_pipeline_version_id=None,
         )
         parent_pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=0,
             pipeline_version=pipeline_version,
             parent_pipeline_version_revision_uuid=None,
-            operators=list(),
-            connections=list(),
+            operators=_EMPTY,
+            connections=_EMPTY,
         )
         pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=1,
             pipeline_version=pipeline_version,
             parent_pipeline_version_revision_uuid=parent_pipeline_version_revision.uuid,
@@ -844,7 +917,7 @@ class TestOperatorModificationModel:
             connections=[connection],
         )
         parent_pipeline_change = PipelineChange(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             pipeline_change_type=PipelineChangeType.CONNECTION_CREATION,
             time=today,
             operator_revision=None,
@@ -853,7 +926,7 @@ class TestOperatorModificationModel:
             parent_pipeline_change_uuid=None,
         )
         pipeline_change = OperatorModificationPipelineChange(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             time=today,
             operator_revision=operator_revision,
             pipeline_version_revision=pipeline_version_revision,
@@ -886,210 +959,74 @@ class TestOperatorDeletionModel:
     ) -> prov.model.ProvDocument:
         doc = prov.model.ProvDocument()
 
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        pipeline_change_activity = doc.activity(
-            pipeline_change.to_prov().identifier,
-            pipeline_change.to_prov().get_startTime(),
-            pipeline_change.to_prov().get_endTime(),
-            pipeline_change.to_prov().attributes,
-        )
-        if parent_pipeline_change:
-            parent_pipeline_change_activity = doc.activity(
-                parent_pipeline_change.to_prov().identifier,
-                parent_pipeline_change.to_prov().get_startTime(),
-                parent_pipeline_change.to_prov().get_endTime(),
-                parent_pipeline_change.to_prov().attributes,
+        # Stage records and attach them to the document in one extend
+        with ProvContext(doc).batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            pipeline_change_activity = _build_header(
+                doc, pipeline_change, parent_pipeline_change
             )
-            doc.wasInformedBy(
-                informed=pipeline_change_activity,
-                informant=parent_pipeline_change_activity,
+            start_time = pipeline_change_activity.get_startTime()
+
+            # Add deleted `Operator`, corresponding `OperatorRevision`, and relations
+            operator_revision = pipeline_change.operator_revision
+            operator_revision_entity = _entity(doc, operator_revision)
+            doc.wasInvalidatedBy(
+                entity=operator_revision_entity,
+                activity=pipeline_change_activity,
+                time=start_time,
                 identifier=relation_qualified_name(
+                    operator_revision_entity,
                     pipeline_change_activity,
-                    parent_pipeline_change_activity,
+                ),
+                other_attributes=_time_role_attrs(
+                    start_time, ProvRole.DELETED_OPERATOR
                 ),
             )
+            operator = operator_revision.operator
+            operator_entity = _entity(doc, operator)
+            doc.specializationOf(
+                specificEntity=operator_revision_entity,
+                generalEntity=operator_entity,
+            )
 
-        # Add deleted `Operator`, corresponding `OperatorRevision`, and relations
-        operator_revision = pipeline_change.operator_revision
-        operator_revision_entity = doc.entity(
-            identifier=operator_revision.to_prov().identifier,
-            other_attributes=operator_revision.to_prov().attributes,
-        )
-        doc.wasInvalidatedBy(
-            entity=operator_revision_entity,
-            activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
-            identifier=relation_qualified_name(
-                operator_revision_entity,
+            # Add `PipelineVersionRevision` with members, `PipelineVersion`, and relations
+            _build_common_tail(
+                doc,
                 pipeline_change_activity,
-            ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.DELETED_OPERATOR),
-            ],
+                start_time,
+                pipeline_change.pipeline_version_revision,
+                parent_pipeline_version_revision,
+            )
+
+        return doc
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def scaffold() -> _Scaffold:
+        return _make_scaffold(
+            parent_change_type=PipelineChangeType.CONNECTION_CREATION,
+            with_parameter=True,
         )
-        operator = operator_revision.operator
-        operator_entity = doc.entity(
-            identifier=operator.to_prov().identifier,
-            other_attributes=operator.to_prov().attributes,
+
+    def test_build(self, scaffold):
+        pipeline_change = OperatorDeletionPipelineChange(
+            uuid=_tuuid(),
+            time=today,
+            operator_revision=scaffold.operator_revision,
+            pipeline_version_revision=scaffold.pipeline_version_revision,
+            parent_pipeline_change_uuid=scaffold.parent_pipeline_change.uuid,
         )
-        doc.specializationOf(
-            specificEntity=operator_revision_entity,
-            generalEntity=operator_entity,
+        model = OperatorDeletionModel(
+            pipeline_change=pipeline_change,
+            parent_pipeline_change=scaffold.parent_pipeline_change,
+            parent_pipeline_version_revision=scaffold.parent_pipeline_version_revision,
         )
 
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = pipeline_change.pipeline_version_revision
-        pipeline_version_revision_entity = doc.entity(
-            identifier=pipeline_version_revision.to_prov().identifier,
-            other_attributes=pipeline_version_revision.to_prov().attributes,
-        )
-        for operator_revision in pipeline_version_revision.operators:
-            operator_revision_entity = doc.entity(
-                identifier=operator_revision.to_prov().identifier,
-                other_attributes=operator_revision.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=operator_revision_entity,
-            )
-        for connection in pipeline_version_revision.connections:
-            connection_entity = doc.entity(
-                identifier=connection.to_prov().identifier,
-                other_attributes=connection.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=connection_entity,
-            )
-        doc.wasGeneratedBy(
-            entity=pipeline_version_revision_entity,
-            activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
-            identifier=relation_qualified_name(
-                pipeline_version_revision_entity, pipeline_change_activity
-            ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.CREATED_PIPELINE_VERSION_REVISION),
-            ],
-        )
-
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        pipeline_version = pipeline_version_revision.pipeline_version
-        pipeline_version_entity = doc.entity(
-            identifier=pipeline_version.to_prov().identifier,
-            other_attributes=pipeline_version.to_prov().attributes,
-        )
-        doc.specializationOf(
-            specificEntity=pipeline_version_revision_entity,
-            generalEntity=pipeline_version_entity,
-        )
-        if parent_pipeline_version_revision:
-            parent_pipeline_version_revision_entity = doc.entity(
-                identifier=parent_pipeline_version_revision.to_prov().identifier,
-                other_attributes=parent_pipeline_version_revision.to_prov().attributes,
-            )
-            doc.wasRevisionOf(
-                generatedEntity=pipeline_version_revision_entity,
-                usedEntity=parent_pipeline_version_revision_entity,
-                identifier=relation_qualified_name(
-                    pipeline_version_revision_entity,
-                    parent_pipeline_version_revision_entity,
-                ),
-            )
-            doc.used(
-                activity=pipeline_change_activity,
-                entity=parent_pipeline_version_revision_entity,
-                time=pipeline_change_activity.get_startTime(),
-                identifier=relation_qualified_name(
-                    pipeline_change_activity,
-                    parent_pipeline_version_revision_entity,
-                ),
-                other_attributes=[
-                    (
-                        str(prov.model.PROV_ROLE),
-                        ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
-                    )
-                ],
-            )
-
-        return doc
-
-    def test_build(self):
-        connection = Connection(
-            id_=0,
-            from_operator_id=0,
-            to_operator_id=1,
-        )
-        operator = Operator(
-            id_=0,
-            name=str(uuid.uuid4()),
-        )
-        parameter = Parameter(
-            name=str(uuid.uuid4()),
-            value=random.uniform(0, 1),
-        )
-        operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
-            id_=0,
-            operator=operator,
-            parameters=[parameter],
-            parent_operator_revision_uuid=None,
-        )
-        pipeline_version = PipelineVersion(
-            id_=0,
-            parent_pipeline_version_id=None,
-        )
-        parent_pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
-            id_=0,
-            pipeline_version=pipeline_version,
-            parent_pipeline_version_revision_uuid=None,
-            operators=list(),
-            connections=list(),
-        )
-        pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
-            id_=1,
-            pipeline_version=pipeline_version,
-            parent_pipeline_version_revision_uuid=parent_pipeline_version_revision.uuid,
-            operators=[operator_revision],
-            connections=[connection],
-        )
-        parent_pipeline_change = PipelineChange(
-            uuid=str(uuid.uuid4()),
-            pipeline_change_type=PipelineChangeType.CONNECTION_CREATION,
-            time=today,
-            operator_revision=None,
-            connection=None,
-            pipeline_version_revision=parent_pipeline_version_revision,
-            parent_pipeline_change_uuid=None,
-        )
-        pipeline_change = OperatorDeletionPipelineChange(
-            uuid=str(uuid.uuid4()),
-            time=today,
-            operator_revision=operator_revision,
-            pipeline_version_revision=pipeline_version_revision,
-            parent_pipeline_change_uuid=parent_pipeline_change.uuid,
-        )
-        model = OperatorDeletionModel(
-            pipeline_change=pipeline_change,
-            parent_pipeline_change=parent_pipeline_change,
-            parent_pipeline_version_revision=parent_pipeline_version_revision,
-        )
-
-        assert (
-            self.build(
-                pipeline_change=pipeline_change,
-                parent_pipeline_change=parent_pipeline_change,
-                parent_pipeline_version_revision=parent_pipeline_version_revision,
+        assert (
+            self.build(
+                pipeline_change=pipeline_change,
+                parent_pipeline_change=scaffold.parent_pipeline_change,
+                parent_pipeline_version_revision=scaffold.parent_pipeline_version_revision,
             )
             == model.build()
         )
@@ -1104,197 +1041,67 @@ class TestConnectionCreationModel:
     ) -> prov.model.ProvDocument:
         doc = prov.model.ProvDocument()
 
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        pipeline_change_activity = doc.activity(
-            pipeline_change.to_prov().identifier,
-            pipeline_change.to_prov().get_startTime(),
-            pipeline_change.to_prov().get_endTime(),
-            pipeline_change.to_prov().attributes,
-        )
-        if parent_pipeline_change:
-            parent_pipeline_change_activity = doc.activity(
-                parent_pipeline_change.to_prov().identifier,
-                parent_pipeline_change.to_prov().get_startTime(),
-                parent_pipeline_change.to_prov().get_endTime(),
-                parent_pipeline_change.to_prov().attributes,
-            )
-            doc.wasInformedBy(
-                informed=pipeline_change_activity,
-                informant=parent_pipeline_change_activity,
-                identifier=relation_qualified_name(
-                    pipeline_change_activity,
-                    parent_pipeline_change_activity,
-                ),
+        # Stage records and attach them to the document in one extend
+        with ProvContext(doc).batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            pipeline_change_activity = _build_header(
+                doc, pipeline_change, parent_pipeline_change
             )
+            start_time = pipeline_change_activity.get_startTime()
 
-        # Add created `Connection` and relation
-        connection = pipeline_change.connection
-        connection_entity = doc.entity(
-            identifier=connection.to_prov().identifier,
-            other_attributes=connection.to_prov().attributes,
-        )
-        doc.wasGeneratedBy(
-            entity=connection_entity,
-            activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
-            identifier=relation_qualified_name(
-                connection_entity,
-                pipeline_change_activity,
-            ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.CREATED_CONNECTION),
-            ],
-        )
-
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = pipeline_change.pipeline_version_revision
-        pipeline_version_revision_entity = doc.entity(
-            identifier=pipeline_version_revision.to_prov().identifier,
-            other_attributes=pipeline_version_revision.to_prov().attributes,
-        )
-        for operator_revision in pipeline_version_revision.operators:
-            operator_revision_entity = doc.entity(
-                identifier=operator_revision.to_prov().identifier,
-                other_attributes=operator_revision.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=operator_revision_entity,
-            )
-        for connection in pipeline_version_revision.connections:
-            connection_entity = doc.entity(
-                identifier=connection.to_prov().identifier,
-                other_attributes=connection.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
+            # Add created `Connection` and relation
+            connection = pipeline_change.connection
+            connection_entity = _entity(doc, connection)
+            doc.wasGeneratedBy(
                 entity=connection_entity,
-            )
-        doc.wasGeneratedBy(
-            entity=pipeline_version_revision_entity,
-            activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
-            identifier=relation_qualified_name(
-                pipeline_version_revision_entity, pipeline_change_activity
-            ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.CREATED_PIPELINE_VERSION_REVISION),
-            ],
-        )
-
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        pipeline_version = pipeline_version_revision.pipeline_version
-        pipeline_version_entity = doc.entity(
-            identifier=pipeline_version.to_prov().identifier,
-            other_attributes=pipeline_version.to_prov().attributes,
-        )
-        doc.specializationOf(
-            specificEntity=pipeline_version_revision_entity,
-            generalEntity=pipeline_version_entity,
-        )
-        if parent_pipeline_version_revision:
-            parent_pipeline_version_revision_entity = doc.entity(
-                identifier=parent_pipeline_version_revision.to_prov().identifier,
-                other_attributes=parent_pipeline_version_revision.to_prov().attributes,
-            )
-            doc.wasRevisionOf(
-                generatedEntity=pipeline_version_revision_entity,
-                usedEntity=parent_pipeline_version_revision_entity,
-                identifier=relation_qualified_name(
-                    pipeline_version_revision_entity,
-                    parent_pipeline_version_revision_entity,
-                ),
-            )
-            doc.used(
                 activity=pipeline_change_activity,
-                entity=parent_pipeline_version_revision_entity,
-                time=pipeline_change_activity.get_startTime(),
+                time=start_time,
                 identifier=relation_qualified_name(
+                    connection_entity,
                     pipeline_change_activity,
-                    parent_pipeline_version_revision_entity,
                 ),
-                other_attributes=[
-                    (
-                        str(prov.model.PROV_ROLE),
-                        ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
-                    )
-                ],
+                other_attributes=_time_role_attrs(
+                    start_time, ProvRole.CREATED_CONNECTION
+                ),
+            )
+
+            # Add `PipelineVersionRevision` with members, `PipelineVersion`, and relations
+            _build_common_tail(
+                doc,
+                pipeline_change_activity,
+                start_time,
+                pipeline_change.pipeline_version_revision,
+                parent_pipeline_version_revision,
             )
 
         return doc
 
-    def test_build(self):
-        connection = Connection(
-            id_=0,
-            from_operator_id=0,
-            to_operator_id=1,
-        )
-        operator = Operator(
-            id_=0,
-            name=str(uuid.uuid4()),
-        )
-        operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
-            id_=0,
-            operator=operator,
-            parameters=list(),
-            parent_operator_revision_uuid=None,
-        )
-        pipeline_version = PipelineVersion(
-            id_=0,
-            parent_pipeline_version_id=None,
-        )
-        parent_pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
-            id_=0,
-            pipeline_version=pipeline_version,
-            parent_pipeline_version_revision_uuid=None,
-            operators=list(),
-            connections=list(),
-        )
-        pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
-            id_=1,
-            pipeline_version=pipeline_version,
-            parent_pipeline_version_revision_uuid=parent_pipeline_version_revision.uuid,
-            operators=[operator_revision],
-            connections=[connection],
-        )
-        parent_pipeline_change = PipelineChange(
-            uuid=str(uuid.uuid4()),
-            pipeline_change_type=PipelineChangeType.CONNECTION_CREATION,
-            time=today,
-            operator_revision=None,
-            connection=None,
-            pipeline_version_revision=parent_pipeline_version_revision,
-            parent_pipeline_change_uuid=None,
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def scaffold() -> _Scaffold:
+        return _make_scaffold(
+            parent_change_type=PipelineChangeType.CONNECTION_CREATION,
         )
+
+    def test_build(self, scaffold):
         pipeline_change = ConnectionCreationPipelineChange(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             time=today,
-            connection=connection,
-            pipeline_version_revision=pipeline_version_revision,
-            parent_pipeline_change_uuid=parent_pipeline_change.uuid,
+            connection=scaffold.connection,
+            pipeline_version_revision=scaffold.pipeline_version_revision,
+            parent_pipeline_change_uuid=scaffold.parent_pipeline_change.uuid,
         )
         model = ConnectionCreationModel(
             pipeline_change=pipeline_change,
-            parent_pipeline_change=parent_pipeline_change,
-            parent_pipeline_version_revision=parent_pipeline_version_revision,
+            parent_pipeline_change=scaffold.parent_pipeline_change,
+            parent_pipeline_version_revision=scaffold.parent_pipeline_version_revision,
         )
 
         assert (
             self.build(
                 pipeline_change=pipeline_change,
-                parent_pipeline_change=parent_pipeline_change,
-                parent_pipeline_version_revision=parent_pipeline_version_revision,
+                parent_pipeline_change=scaffold.parent_pipeline_change,
+                parent_pipeline_version_revision=scaffold.parent_pipeline_version_revision,
             )
             == model.build()
         )
@@ -1309,197 +1116,67 @@ class TestConnectionDeletionModel:
     ) -> prov.model.ProvDocument:
         doc = prov.model.ProvDocument()
 
-        # Add `PipelineChange`, parent `PipelineChange`, and relation
-        pipeline_change_activity = doc.activity(
-            pipeline_change.to_prov().identifier,
-            pipeline_change.to_prov().get_startTime(),
-            pipeline_change.to_prov().get_endTime(),
-            pipeline_change.to_prov().attributes,
-        )
-        if parent_pipeline_change:
-            parent_pipeline_change_activity = doc.activity(
-                parent_pipeline_change.to_prov().identifier,
-                parent_pipeline_change.to_prov().get_startTime(),
-                parent_pipeline_change.to_prov().get_endTime(),
-                parent_pipeline_change.to_prov().attributes,
-            )
-            doc.wasInformedBy(
-                informed=pipeline_change_activity,
-                informant=parent_pipeline_change_activity,
-                identifier=relation_qualified_name(
-                    pipeline_change_activity,
-                    parent_pipeline_change_activity,
-                ),
+        # Stage records and attach them to the document in one extend
+        with ProvContext(doc).batch():
+            # Add `PipelineChange`, parent `PipelineChange`, and relation
+            pipeline_change_activity = _build_header(
+                doc, pipeline_change, parent_pipeline_change
             )
+            start_time = pipeline_change_activity.get_startTime()
 
-        # Add deleted `Connection` and relation
-        connection = pipeline_change.connection
-        connection_entity = doc.entity(
-            identifier=connection.to_prov().identifier,
-            other_attributes=connection.to_prov().attributes,
-        )
-        doc.wasInvalidatedBy(
-            entity=connection_entity,
-            activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
-            identifier=relation_qualified_name(
-                connection_entity,
-                pipeline_change_activity,
-            ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.DELETED_CONNECTION),
-            ],
-        )
-
-        # Add `PipelineVersionRevision`, corresponding `OperatorRevision` and `Connection` members, and relations
-        pipeline_version_revision = pipeline_change.pipeline_version_revision
-        pipeline_version_revision_entity = doc.entity(
-            identifier=pipeline_version_revision.to_prov().identifier,
-            other_attributes=pipeline_version_revision.to_prov().attributes,
-        )
-        for operator_revision in pipeline_version_revision.operators:
-            operator_revision_entity = doc.entity(
-                identifier=operator_revision.to_prov().identifier,
-                other_attributes=operator_revision.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
-                entity=operator_revision_entity,
-            )
-        for connection in pipeline_version_revision.connections:
-            connection_entity = doc.entity(
-                identifier=connection.to_prov().identifier,
-                other_attributes=connection.to_prov().attributes,
-            )
-            doc.hadMember(
-                collection=pipeline_version_revision_entity,
+            # Add deleted `Connection` and relation
+            connection = pipeline_change.connection
+            connection_entity = _entity(doc, connection)
+            doc.wasInvalidatedBy(
                 entity=connection_entity,
-            )
-        doc.wasGeneratedBy(
-            entity=pipeline_version_revision_entity,
-            activity=pipeline_change_activity,
-            time=pipeline_change_activity.get_startTime(),
-            identifier=relation_qualified_name(
-                pipeline_version_revision_entity, pipeline_change_activity
-            ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    pipeline_change_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.CREATED_PIPELINE_VERSION_REVISION),
-            ],
-        )
-
-        # Add `PipelineVersion`, parent `PipelineVersionRevision`, and relations
-        pipeline_version = pipeline_version_revision.pipeline_version
-        pipeline_version_entity = doc.entity(
-            identifier=pipeline_version.to_prov().identifier,
-            other_attributes=pipeline_version.to_prov().attributes,
-        )
-        doc.specializationOf(
-            specificEntity=pipeline_version_revision_entity,
-            generalEntity=pipeline_version_entity,
-        )
-        if parent_pipeline_version_revision:
-            parent_pipeline_version_revision_entity = doc.entity(
-                identifier=parent_pipeline_version_revision.to_prov().identifier,
-                other_attributes=parent_pipeline_version_revision.to_prov().attributes,
-            )
-            doc.wasRevisionOf(
-                generatedEntity=pipeline_version_revision_entity,
-                usedEntity=parent_pipeline_version_revision_entity,
-                identifier=relation_qualified_name(
-                    pipeline_version_revision_entity,
-                    parent_pipeline_version_revision_entity,
-                ),
-            )
-            doc.used(
                 activity=pipeline_change_activity,
-                entity=parent_pipeline_version_revision_entity,
-                time=pipeline_change_activity.get_startTime(),
+                time=start_time,
                 identifier=relation_qualified_name(
+                    connection_entity,
                     pipeline_change_activity,
-                    parent_pipeline_version_revision_entity,
                 ),
-                other_attributes=[
-                    (
-                        str(prov.model.PROV_ROLE),
-                        ProvRole.USED_PARENT_PIPELINE_VERSION_REVISION,
-                    )
-                ],
+                other_attributes=_time_role_attrs(
+                    start_time, ProvRole.DELETED_CONNECTION
+                ),
+            )
+
+            # Add `PipelineVersionRevision` with members, `PipelineVersion`, and relations
+            _build_common_tail(
+                doc,
+                pipeline_change_activity,
+                start_time,
+                pipeline_change.pipeline_version_revision,
+                parent_pipeline_version_revision,
             )
 
         return doc
 
-    def test_build(self):
-        connection = Connection(
-            id_=0,
-            from_operator_id=0,
-            to_operator_id=1,
-        )
-        operator = Operator(
-            id_=0,
-            name=str(uuid.uuid4()),
-        )
-        operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
-            id_=0,
-            operator=operator,
-            parameters=list(),
-            parent_operator_revision_uuid=None,
-        )
-        pipeline_version = PipelineVersion(
-            id_=0,
-            parent_pipeline_version_id=None,
-        )
-        parent_pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
-            id_=0,
-            pipeline_version=pipeline_version,
-            parent_pipeline_version_revision_uuid=None,
-            operators=list(),
-            connections=list(),
-        )
-        pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
-            id_=1,
-            pipeline_version=pipeline_version,
-            parent_pipeline_version_revision_uuid=parent_pipeline_version_revision.uuid,
-            operators=[operator_revision],
-            connections=[connection],
-        )
-        parent_pipeline_change = PipelineChange(
-            uuid=str(uuid.uuid4()),
-            pipeline_change_type=PipelineChangeType.CONNECTION_DELETION,
-            time=today,
-            operator_revision=None,
-            connection=None,
-            pipeline_version_revision=parent_pipeline_version_revision,
-            parent_pipeline_change_uuid=None,
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def scaffold() -> _Scaffold:
+        return _make_scaffold(
+            parent_change_type=PipelineChangeType.CONNECTION_DELETION,
         )
+
+    def test_build(self, scaffold):
         pipeline_change = ConnectionDeletionPipelineChange(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             time=today,
-            connection=connection,
-            pipeline_version_revision=pipeline_version_revision,
-            parent_pipeline_change_uuid=parent_pipeline_change.uuid,
+            connection=scaffold.connection,
+            pipeline_version_revision=scaffold.pipeline_version_revision,
+            parent_pipeline_change_uuid=scaffold.parent_pipeline_change.uuid,
         )
         model = ConnectionDeletionModel(
             pipeline_change=pipeline_change,
-            parent_pipeline_change=parent_pipeline_change,
-            parent_pipeline_version_revision=parent_pipeline_version_revision,
+            parent_pipeline_change=scaffold.parent_pipeline_change,
+            parent_pipeline_version_revision=scaffold.parent_pipeline_version_revision,
         )
 
         assert (
             self.build(
                 pipeline_change=pipeline_change,
-                parent_pipeline_change=parent_pipeline_change,
-                parent_pipeline_version_revision=parent_pipeline_version_revision,
+                parent_pipeline_change=scaffold.parent_pipeline_change,
+                parent_pipeline_version_revision=scaffold.parent_pipeline_version_revision,
             )
             == model.build()
         )
@@ -1513,57 +1190,44 @@ class TestOperationExecutionModel:
         doc = prov.model.ProvDocument()
 
         # Add `OperatorExecution`, `OperatorRevision`, and relation
+        operator_execution_proj = project(operator_execution)
         operator_execution_activity = doc.activity(
-            operator_execution.to_prov().identifier,
-            operator_execution.to_prov().get_startTime(),
-            operator_execution.to_prov().get_endTime(),
-            operator_execution.to_prov().attributes,
+            operator_execution_proj.identifier,
+            operator_execution_proj.start_time,
+            operator_execution_proj.end_time,
+            operator_execution_proj.attributes,
         )
+        start_time = operator_execution_activity.get_startTime()
         operator_revision = operator_execution.operator_revision
-        operator_revision_entity = doc.entity(
-            identifier=operator_revision.to_prov().identifier,
-            other_attributes=operator_revision.to_prov().attributes,
-        )
+        operator_revision_entity = _entity(doc, operator_revision)
         doc.used(
             activity=operator_execution_activity,
             entity=operator_revision_entity,
-            time=operator_execution_activity.get_startTime(),
+            time=start_time,
             identifier=relation_qualified_name(
                 operator_execution_activity, operator_revision_entity
             ),
-            other_attributes=[
-                (str(prov.model.PROV_ROLE), ProvRole.USED_OPERATOR_REVISION)
-            ],
+            other_attributes=_ATTRS_USED_OPERATOR_REVISION,
         )
 
         # Add `OperatorRun` and relation
         operator_run = operator_execution.operator_run
-        operator_run_entity = doc.entity(
-            identifier=operator_run.to_prov().identifier,
-            other_attributes=operator_run.to_prov().attributes,
-        )
+        operator_run_entity = _entity(doc, operator_run)
         doc.wasGeneratedBy(
             entity=operator_run_entity,
             activity=operator_execution_activity,
-            time=operator_execution_activity.get_startTime(),
+            time=start_time,
             identifier=relation_qualified_name(
                 operator_run_entity, operator_execution_activity
             ),
-            other_attributes=[
-                (
-                    str(prov.model.PROV_ATTR_TIME),
-                    operator_execution_activity.get_startTime(),
-                ),
-                (str(prov.model.PROV_ROLE), ProvRole.CREATED_OPERATOR_RUN),
-            ],
+            other_attributes=_time_role_attrs(
+                start_time, ProvRole.CREATED_OPERATOR_RUN
+            ),
         )
 
         # Add `Metric`s and relations
         for metric in operator_run.metrics:
-            metric_entity = doc.entity(
-                identifier=metric.to_prov().identifier,
-                other_attributes=metric.to_prov().attributes,
-            )
+            metric_entity = _entity(doc, metric)
             doc.hadMember(
                 collection=operator_run_entity,
                 entity=metric_entity,
@@ -1578,26 +1242,26 @@ class TestOperationExecutionModel:
     def test_build(self):
         operator = Operator(
             id_=0,
-            name=str(uuid.uuid4()),
+            name=_tuuid(),
         )
         operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             id_=0,
             operator=operator,
             parameters=list(),
             parent_operator_revision_uuid=None,
         )
         metric = Metric(
-            name=str(uuid.uuid4()),
+            name=_tuuid(),
             value=random.uniform(0, 1),
         )
         operator_run = OperatorRun(
-            id_=str(uuid.uuid4()),
+            id_=_tuuid(),
             created_at=today,
             metrics=[metric],
         )
         operator_execution = OperatorExecution(
-            uuid=str(uuid.uuid4()),
+            uuid=_tuuid(),
             operator_revision=operator_revision,
             operator_run=operator_run,
             operator_step_type=OperatorStepType.ON_OP_EXECUTED,
@@ -1607,4 +1271,6 @@ class TestOperationExecutionModel:
             operator_execution=operator_execution,
         )
 
-        assert self.build(operator_execution) == model.build()
+        # Compare canonical record signatures instead of the quadratic
+        # record-bag comparison of `ProvDocument.__eq__`
+        assert ProvContext(self.build(operator_execution)) == ProvContext(model.build())
@@ -1,10 +1,8 @@
-import datetime
 import random
-import uuid
 from pathlib import Path
+from typing import Iterator
 
 import pytest
-from py2neo.cypher import Cursor
 
 from provinspector.domain.model import (
     Connection,
@@ -17,17 +15,15 @@ from provinspector.domain.model import (
 )
 from provinspector.prov.model import Model, PipelineVersionCreationModel
 from provinspector.provinspector import ProvInspector
-from provinspector.storage.adapter import Neo4JAdapter
-from provinspector.storage.database import ProvGraphDatabase
 from provinspector.utils.dumper import JsonDumper
-from tests.fixtures import neo4j_context
+from tests.fixtures import neo4j_context, precomputed_ids, provinspector
 
 
 def query_and_print_all_nodes(
     provinspector: ProvInspector,
     do_print: bool = True,
 ) -> None:
-    result: Cursor = provinspector.query(query="""MATCH (n) RETURN (n)""")
+    result: Iterator = provinspector.query(query="""MATCH (n) RETURN (n)""")
     if do_print:
         for r in result:
             print(r)
@@ -37,7 +33,7 @@ def query_and_print_all_relationships(
     provinspector: ProvInspector,
     do_print: bool = True,
 ) -> None:
-    result: Cursor = provinspector.query(
+    result: Iterator = provinspector.query(
         query="""
         MATCH ()-[r]-()
         RETURN r
@@ -48,20 +44,17 @@ def query_and_print_all_relationships(
             print(r)
 
 
-@pytest.mark.usefixtures("neo4j_context")
+# Pin to the worker running all tests that touch the shared Neo4J instance
+@pytest.mark.xdist_group("neo4j")
 class TestProvInspector:
-    def test_provinspector(self):
-        # Initialize ProvInspector
-        provinspector = ProvInspector(
-            provenance_database=ProvGraphDatabase(
-                adapter=Neo4JAdapter(
-                    use_docker=False,
-                )
-            ),
-        )
+    @pytest.fixture(autouse=True)
+    def _clean_database(self, provinspector):
+        provinspector.clear()
 
+    def test_provinspector(self, provinspector, precomputed_ids):
         # Create PipelineVersionCreation
-        today = datetime.datetime.now()
+        today = precomputed_ids["today"]
+        uuids = iter(precomputed_ids["uuids"])
         connection = Connection(
             id_=0,
             from_operator_id=0,
@@ -69,14 +62,14 @@ class TestProvInspector:
         )
         operator = Operator(
             id_=0,
-            name=str(uuid.uuid4()),
+            name=next(uuids),
         )
         parameter = Parameter(
-            name=str(uuid.uuid4()),
+            name=next(uuids),
             value=random.uniform(0, 1),
         )
         operator_revision = OperatorRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=next(uuids),
             id_=0,
             operator=operator,
             parameters=[parameter],
@@ -87,7 +80,7 @@ class TestProvInspector:
             parent_pipeline_version_id=None,
         )
         pipeline_version_revision = PipelineVersionRevision(
-            uuid=str(uuid.uuid4()),
+            uuid=next(uuids),
             id_=0,
             pipeline_version=pipeline_version,
             parent_pipeline_version_revision_uuid=None,
@@ -95,7 +88,7 @@ class TestProvInspector:
             connections=[connection],
         )
         pipeline_version_creation = PipelineVersionCreation(
-            uuid=str(uuid.uuid4()),
+            uuid=next(uuids),
             pipeline_version_revision=pipeline_version_revision,
             parent_pipeline_version_creation_uuid=None,
             time=today,
@@ -120,38 +113,18 @@ class TestProvInspector:
         # Clear
         provinspector.clear()
 
-        # Query
-        query_and_print_all_nodes(provinspector=provinspector)
-
-        # Shutdown
-        provinspector.shutdown()
-
-    def test_initialize_and_update(self):
-        # Initialize ProvInspector
-        provinspector = ProvInspector(
-            provenance_database=ProvGraphDatabase(
-                adapter=Neo4JAdapter(
-                    use_docker=False,
-                )
-            ),
-        )
-        provinspector.clear()
-
+    def test_initialize_and_update(self, provinspector):
         # Test initialize
-        data = list(
-            JsonDumper.load_init_data(
+        provinspector.initialize(
+            data=JsonDumper.load_init_data(
                 path=Path(__file__).parent / "resources" / "dump_init.txt"
             )
         )
-        provinspector.initialize(data=data)
 
         # Test update
-        data = list(
-            JsonDumper.load_execution_data(
-                path=Path(__file__).parent / "resources" / "dump_exec.txt"
-            )
-        )
-        for d in data:
+        for d in JsonDumper.load_execution_data(
+            path=Path(__file__).parent / "resources" / "dump_exec.txt"
+        ):
             provinspector.update(data=d)
 
         # Query and print results
@@ -163,6 +136,3 @@ class TestProvInspector:
             provinspector=provinspector,
             do_print=False,
         )
-
-        # Shutdown
-        provinspector.shutdown()